@@ -1,27 +1,72 @@
 """divera component."""
 
 import asyncio
+from functools import partial
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_KEY, CONF_NAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     CONF_FLOW_MINOR_VERSION,
     CONF_FLOW_VERSION,
     DATA_ACCESSKEY,
+    DATA_ALARM_GROUPS,
+    DATA_ALARM_HISTORY_DEPTH,
     DATA_BASE_URL,
     DATA_DIVERA_COORDINATOR,
+    DATA_DIVERA_FETCHER,
+    DATA_DIVERA_STORE,
+    DATA_DIVERA_VEHICLE_COORDINATOR,
+    DATA_SCAN_INTERVAL,
+    DATA_STALE_WINDOW,
+    DATA_UCR_SCAN_INTERVALS,
     DATA_UCRS,
+    DEFAULT_ALARM_HISTORY_DEPTH,
+    DEFAULT_FIRST_REFRESH_STAGGER,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STALE_WINDOW,
     DIVERA_BASE_URL,
     DOMAIN,
     LOGGER,
+    REQUIRED_SECTIONS,
+    VERSION_PRO,
 )
 from .coordinator import DiveraCoordinator
-from .divera import DiveraClient, DiveraError
+from .divera import DiveraClient, DiveraError, DiveraFetcher
+from .push import async_register_webhook, async_unregister_webhook
+from .services import async_setup_services
+from .session import async_get_session, async_release_session
+from .store import DiveraStore, async_remove_store
+from .vehicles import async_get_vehicle_coordinator, async_release_vehicle_coordinator
 
-PLATFORMS = [Platform.SELECT, Platform.SENSOR]
+PLATFORMS = [
+    Platform.BINARY_SENSOR,
+    Platform.CALENDAR,
+    Platform.GEO_LOCATION,
+    Platform.SELECT,
+    Platform.SENSOR,
+]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the services of Divera.
+
+    Args:
+        hass (HomeAssistant): The Home Assistant instance.
+        config (ConfigType): The configuration of Home Assistant.
+
+    Returns:
+        bool: Always True.
+
+    """
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
@@ -39,37 +84,149 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     divera_hass_data = hass.data.setdefault(DOMAIN, {})
     divera_hass_data[entry.entry_id] = {}
 
-    websession = async_get_clientsession(hass)
+    websession = async_get_session(hass, base_url)
+    entry.async_on_unload(partial(async_release_session, hass, base_url))
+    fetcher = DiveraFetcher(
+        websession, accesskey, base_url=base_url, sections=REQUIRED_SECTIONS
+    )
+    divera_hass_data[entry.entry_id][DATA_DIVERA_FETCHER] = fetcher
+    store = DiveraStore(hass, entry.entry_id, fetcher)
+    divera_hass_data[entry.entry_id][DATA_DIVERA_STORE] = store
+    payloads = await store.async_load()
+
     tasks = []
-    for ucr_id in ucr_ids:
+    for index, ucr_id in enumerate(ucr_ids):
         divera_coordinator = DiveraCoordinator(
-            hass, websession, accesskey, base_url=base_url, ucr_id=ucr_id
+            hass,
+            websession,
+            accesskey,
+            base_url=base_url,
+            ucr_id=ucr_id,
+            fetcher=fetcher,
+            update_interval=get_scan_interval(entry, ucr_id),
+            alarm_history_depth=entry.options.get(
+                DATA_ALARM_HISTORY_DEPTH, DEFAULT_ALARM_HISTORY_DEPTH
+            ),
+            store=store,
+            stale_window=entry.options.get(DATA_STALE_WINDOW, DEFAULT_STALE_WINDOW),
         )
+        divera_coordinator.set_alarm_groups(entry.options.get(DATA_ALARM_GROUPS, []))
         divera_hass_data[entry.entry_id][ucr_id] = {
             DATA_DIVERA_COORDINATOR: divera_coordinator
         }
 
-        tasks.append(
-            asyncio.create_task(divera_coordinator.async_config_entry_first_refresh())
-        )
+        # Units with persisted data are set up from it right away and
+        # reconciled by a refresh in the background.
+        delay = index * DEFAULT_FIRST_REFRESH_STAGGER
+        payload = payloads.get(str(ucr_id))
+        if payload is not None and divera_coordinator.async_restore(payload):
+            entry.async_create_background_task(
+                hass,
+                _async_refresh(divera_coordinator, delay, first=False),
+                f"{DOMAIN} refresh {ucr_id}",
+            )
+        else:
+            tasks.append(asyncio.create_task(_async_refresh(divera_coordinator, delay)))
 
-    await asyncio.wait(tasks)
+    if tasks:
+        await asyncio.wait(tasks)
 
+    # Vehicles are the same for every user of a cluster, so they are pulled by
+    # one coordinator per cluster shared with the other entries.
+    for ucr_id in ucr_ids:
+        divera_client = divera_hass_data[entry.entry_id][ucr_id][
+            DATA_DIVERA_COORDINATOR
+        ].data
+        if divera_client is None or divera_client.get_cluster_version() != VERSION_PRO:
+            continue
+        cluster_id = divera_client.get_cluster_id_from_ucr(ucr_id)
+        entry.async_on_unload(
+            partial(
+                async_release_vehicle_coordinator,
+                hass,
+                entry.entry_id,
+                base_url,
+                cluster_id,
+            )
+        )
+        divera_hass_data[entry.entry_id][ucr_id][
+            DATA_DIVERA_VEHICLE_COORDINATOR
+        ] = await async_get_vehicle_coordinator(
+            hass, entry.entry_id, fetcher, base_url, cluster_id, ucr_id
+        )
+
+    async_register_webhook(hass, entry)
     entry.async_on_unload(entry.add_update_listener(async_update_listener))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
+async def _async_refresh(
+    coordinator: DiveraCoordinator, delay: float, first: bool = True
+) -> None:
+    """Refresh a coordinator after the given delay.
+
+    Args:
+        coordinator (DiveraCoordinator): The coordinator to refresh.
+        delay (float): Seconds to wait before refreshing.
+        first (bool, optional): Whether to run the first refresh of the config entry,
+            which raises if it fails. Defaults to True.
+
+    """
+    if delay:
+        await asyncio.sleep(delay)
+    if first:
+        await coordinator.async_config_entry_first_refresh()
+    else:
+        await coordinator.async_refresh()
+
+
+def get_scan_interval(entry: ConfigEntry, ucr_id) -> int:
+    """Return the configured polling interval of a UCR.
+
+    Args:
+        entry (ConfigEntry): The config entry for Divera.
+        ucr_id (int): The UCR to get the interval for.
+
+    Returns:
+        int: The per UCR override if set, otherwise the interval of the entry.
+
+    """
+    scan_interval = entry.options.get(DATA_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    ucr_scan_intervals = entry.options.get(DATA_UCR_SCAN_INTERVALS, {})
+    return ucr_scan_intervals.get(str(ucr_id), scan_interval)
+
+
 async def async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Asynchronous update listener.
 
+    Applies the polling intervals, the stale window, the depth of the alarm
+    history, the groups of the active alarm sensor and the push webhook of the
+    options to the running entry. Changes of the selected units are applied by
+    the reconfigure flow, which reloads the entry itself.
+
     Args:
         hass (HomeAssistant): Home Assistant instance.
         entry (ConfigEntry): Configuration entry to update.
 
     """
-    await hass.config_entries.async_reload(entry_id=entry.entry_id)
+    divera_hass_data = hass.data[DOMAIN][entry.entry_id]
+    for ucr_id in entry.data.get(DATA_UCRS):
+        if ucr_id not in divera_hass_data:
+            continue
+        coordinator: DiveraCoordinator = divera_hass_data[ucr_id][
+            DATA_DIVERA_COORDINATOR
+        ]
+        coordinator.set_scan_interval(get_scan_interval(entry, ucr_id))
+        coordinator.set_stale_window(
+            entry.options.get(DATA_STALE_WINDOW, DEFAULT_STALE_WINDOW)
+        )
+        coordinator.set_alarm_groups(entry.options.get(DATA_ALARM_GROUPS, []))
+        coordinator.set_alarm_history_depth(
+            entry.options.get(DATA_ALARM_HISTORY_DEPTH, DEFAULT_ALARM_HISTORY_DEPTH)
+        )
+    async_register_webhook(hass, entry)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
@@ -92,12 +249,26 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         )
     )
     if unload_ok:
+        async_unregister_webhook(hass, entry)
+        store: DiveraStore = hass.data[DOMAIN][entry.entry_id][DATA_DIVERA_STORE]
+        await store.async_flush()
         hass.data[DOMAIN].pop(entry.entry_id)
         if not hass.data[DOMAIN]:
             hass.data.pop(DOMAIN)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted data of a removed Divera config entry.
+
+    Args:
+        hass (HomeAssistant): The Home Assistant instance.
+        entry (ConfigEntry): The removed config entry.
+
+    """
+    await async_remove_store(hass, entry.entry_id)
+
+
 async def async_migrate_entry(hass, config_entry: ConfigEntry):
     """Migrate old entry.
 
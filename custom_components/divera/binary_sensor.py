@@ -0,0 +1,114 @@
+"""Binary Sensor Module for Divera Integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import ACTIVE_ALARM, DATA_DIVERA_COORDINATOR, DATA_UCRS, DOMAIN
+from .coordinator import DiveraCoordinator
+from .divera import DiveraClient
+from .entity import DiveraEntity, DiveraEntityDescription
+
+
+@dataclass(frozen=True, kw_only=True)
+class DiveraBinarySensorEntityDescription(
+    DiveraEntityDescription, BinarySensorEntityDescription
+):
+    """Description of a Divera binary sensor entity.
+
+    Inherits from both DiveraEntityDescription and BinarySensorEntityDescription.
+
+    Attributes:
+        is_on_fn (Callable[[DiveraClient], bool]):
+            Function that returns the state of the binary sensor.
+
+    """
+
+    is_on_fn: Callable[[DiveraClient], bool]
+
+
+BINARY_SENSORS: tuple[DiveraBinarySensorEntityDescription, ...] = (
+    DiveraBinarySensorEntityDescription(
+        key="alarm_active",
+        translation_key="alarm_active",
+        icon="mdi:alarm-light",
+        device_class=BinarySensorDeviceClass.SAFETY,
+        is_on_fn=lambda divera: divera.is_alarm_active(),
+        attribute_fn=lambda divera: divera.get_active_alarm_attributes(),
+        sections=("alarm", ACTIVE_ALARM),
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Divera binary sensor entities.
+
+    Args:
+        hass (HomeAssistant): Home Assistant instance.
+        entry (ConfigEntry): Configuration entry for the integration.
+        async_add_entities (AddEntitiesCallback): Function to add entities.
+
+    """
+    ucr_ids: list[int] = entry.data[DATA_UCRS]
+
+    entities: list[DiveraBinarySensorEntity] = []
+
+    for ucr_id in ucr_ids:
+        coordinator = hass.data[DOMAIN][entry.entry_id][ucr_id][DATA_DIVERA_COORDINATOR]
+        entities.extend(
+            [
+                DiveraBinarySensorEntity(coordinator, description)
+                for description in BINARY_SENSORS
+            ],
+        )
+
+    async_add_entities(entities, False)
+
+
+class DiveraBinarySensorEntity(DiveraEntity, BinarySensorEntity):
+    """Represents a Divera binary sensor entity.
+
+    Inherits from both DiveraEntity and BinarySensorEntity. The state is
+    computed by the client when the alarms are applied, so the entity only
+    reads it.
+
+    Attributes:
+        entity_description (DiveraBinarySensorEntityDescription):
+            Description of the binary sensor entity.
+
+    """
+
+    entity_description: DiveraBinarySensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: DiveraCoordinator,
+        description: DiveraBinarySensorEntityDescription,
+    ) -> None:
+        """Initialize DiveraBinarySensorEntity.
+
+        Args:
+            coordinator (DiveraCoordinator): The coordinator managing this entity.
+            description (DiveraBinarySensorEntityDescription): Description of the binary sensor entity.
+
+        """
+        super().__init__(coordinator, description)
+
+    def _divera_update(self) -> None:
+        self._attr_is_on = self.entity_description.is_on_fn(self.coordinator.data)
+        attributes = self.entity_description.attribute_fn(self.coordinator.data)
+        self._attr_extra_state_attributes = attributes
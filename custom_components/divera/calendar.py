@@ -0,0 +1,194 @@
+"""Calendar Module for Divera Integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from math import ceil
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+import homeassistant.util.dt as dt_util
+
+from .const import DATA_DIVERA_COORDINATOR, DATA_UCRS, DOMAIN
+from .coordinator import DiveraCoordinator
+from .divera import DiveraClient
+from .entity import DiveraEntity, DiveraEntityDescription
+
+
+@dataclass(frozen=True, kw_only=True)
+class DiveraCalendarEntityDescription(DiveraEntityDescription):
+    """Description of a Divera calendar entity.
+
+    Attributes:
+        events_fn (Callable[[DiveraClient, int, int], list[dict]]):
+            Function that returns the events overlapping a range of timestamps.
+        next_event_fn (Callable[[DiveraClient, int], dict | None]):
+            Function that returns the event in progress at a timestamp, or else the next one.
+
+    """
+
+    events_fn: Callable[[DiveraClient, int, int], list[dict]]
+    next_event_fn: Callable[[DiveraClient, int], dict | None]
+
+
+CALENDARS: tuple[DiveraCalendarEntityDescription, ...] = (
+    DiveraCalendarEntityDescription(
+        key="events",
+        translation_key="events",
+        icon="mdi:calendar-account",
+        events_fn=lambda divera, start, end: divera.get_events(start, end),
+        next_event_fn=lambda divera, at: divera.get_next_event(at),
+        attribute_fn=lambda divera: {},
+        sections=("events",),
+    ),
+    DiveraCalendarEntityDescription(
+        key="status_plan",
+        translation_key="status_plan",
+        icon="mdi:calendar-clock",
+        events_fn=lambda divera, start, end: divera.get_status_plan(start, end),
+        next_event_fn=lambda divera, at: divera.get_next_status_plan(at),
+        attribute_fn=lambda divera: {},
+        sections=("statusplan", "cluster"),
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Divera calendar entities.
+
+    Args:
+        hass (HomeAssistant): Home Assistant instance.
+        entry (ConfigEntry): Configuration entry for the integration.
+        async_add_entities (AddEntitiesCallback): Function to add entities.
+
+    """
+    ucr_ids: list[int] = entry.data[DATA_UCRS]
+
+    entities: list[DiveraCalendarEntity] = []
+
+    for ucr_id in ucr_ids:
+        coordinator = hass.data[DOMAIN][entry.entry_id][ucr_id][DATA_DIVERA_COORDINATOR]
+        entities.extend(
+            [
+                DiveraCalendarEntity(coordinator, description)
+                for description in CALENDARS
+            ],
+        )
+
+    async_add_entities(entities, False)
+
+
+class DiveraCalendarEntity(DiveraEntity, CalendarEntity):
+    """Represents a Divera calendar entity.
+
+    Inherits from both DiveraEntity and CalendarEntity. Events are looked up
+    in the calendar indexes of the client, so range queries of the calendar
+    do not walk all events of the cluster.
+
+    Attributes:
+        entity_description (DiveraCalendarEntityDescription):
+            Description of the calendar entity.
+
+    """
+
+    entity_description: DiveraCalendarEntityDescription
+
+    def __init__(
+        self,
+        coordinator: DiveraCoordinator,
+        description: DiveraCalendarEntityDescription,
+    ) -> None:
+        """Initialize DiveraCalendarEntity.
+
+        Args:
+            coordinator (DiveraCoordinator): The coordinator managing this entity.
+            description (DiveraCalendarEntityDescription): Description of the calendar entity.
+
+        """
+        super().__init__(coordinator, description)
+
+    def _divera_update(self) -> None:
+        attributes = self.entity_description.attribute_fn(self.coordinator.data)
+        self._attr_extra_state_attributes = attributes
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the event in progress, or else the next upcoming event.
+
+        Returns:
+            CalendarEvent | None: The event, None if there is none.
+
+        """
+        event = self.entity_description.next_event_fn(
+            self.coordinator.data, int(dt_util.utcnow().timestamp())
+        )
+        return None if event is None else get_calendar_event(event)
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the events overlapping a range.
+
+        Args:
+            hass (HomeAssistant): Home Assistant instance.
+            start_date (datetime): Start of the range.
+            end_date (datetime): End of the range.
+
+        Returns:
+            list[CalendarEvent]: The events, ordered by start.
+
+        """
+        events = self.entity_description.events_fn(
+            self.coordinator.data,
+            int(start_date.timestamp()),
+            ceil(end_date.timestamp()),
+        )
+        events.sort(key=lambda event: event["start"])
+        return [get_calendar_event(event) for event in events]
+
+
+def get_calendar_event(event: dict) -> CalendarEvent:
+    """Convert an event of the client to a calendar event.
+
+    All-day events span the local dates from their start to their end.
+
+    Args:
+        event (dict): The event as returned by DiveraClient.get_next_event.
+
+    Returns:
+        CalendarEvent: The calendar event.
+
+    """
+    start = dt_util.as_local(dt_util.utc_from_timestamp(event["start"]))
+    end = dt_util.as_local(dt_util.utc_from_timestamp(event["end"]))
+    if event["all_day"]:
+        start_date = start.date()
+        end_date = end.date()
+        if end_date <= start_date or end.time() != datetime.min.time():
+            end_date += timedelta(days=1)
+        return CalendarEvent(
+            start=start_date,
+            end=end_date,
+            summary=event["summary"],
+            description=event["description"],
+            location=event["location"],
+            uid=event["uid"],
+        )
+    if end <= start:
+        end = start + timedelta(seconds=1)
+    return CalendarEvent(
+        start=start,
+        end=end,
+        summary=event["summary"],
+        description=event["description"],
+        location=event["location"],
+        uid=event["uid"],
+    )
@@ -4,15 +4,25 @@ from typing import Any
 
 from voluptuous import Optional, Required, Schema
 
+from homeassistant.components import webhook
 from homeassistant.config_entries import (
     HANDLERS,
     ConfigEntry,
     ConfigFlow,
     ConfigFlowResult,
+    OptionsFlow,
 )
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowHandler
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.network import NoURLAvailableError
 from homeassistant.helpers.selector import (
+    BooleanSelector,
+    LocationSelector,
+    LocationSelectorConfig,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     SelectSelector,
     SelectSelectorConfig,
     TextSelector,
@@ -22,20 +32,44 @@ from homeassistant.helpers.selector import (
 
 from .const import (
     CONF_ACCESSKEY,
+    CONF_ALARM_GROUPS,
+    CONF_ALARM_HISTORY_DEPTH,
     CONF_BASE_URL,
     CONF_CLUSTERS,
     CONF_FLOW_MINOR_VERSION,
     CONF_FLOW_NAME_API,
     CONF_FLOW_NAME_RECONFIGURE,
+    CONF_FLOW_NAME_SCAN_INTERVAL,
     CONF_FLOW_NAME_UCR,
     CONF_FLOW_VERSION,
+    CONF_SCAN_INTERVAL,
+    CONF_STALE_WINDOW,
+    CONF_STATION,
+    CONF_WEBHOOK,
     DATA_ACCESSKEY,
+    DATA_ALARM_GROUPS,
+    DATA_ALARM_HISTORY_DEPTH,
     DATA_BASE_URL,
+    DATA_DIVERA_COORDINATOR,
+    DATA_SCAN_INTERVAL,
+    DATA_STALE_WINDOW,
+    DATA_STATION,
+    DATA_UCR_SCAN_INTERVALS,
     DATA_UCRS,
+    DATA_WEBHOOK_ID,
+    DEFAULT_ALARM_HISTORY_DEPTH,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STALE_WINDOW,
     DIVERA_BASE_URL,
     DOMAIN,
     ERROR_AUTH,
     ERROR_CONNECTION,
+    MAX_ALARM_HISTORY_DEPTH,
+    MAX_SCAN_INTERVAL,
+    MAX_STALE_WINDOW,
+    MIN_ALARM_HISTORY_DEPTH,
+    MIN_SCAN_INTERVAL,
+    MIN_STALE_WINDOW,
 )
 from .divera import DiveraAuthError, DiveraClient, DiveraConnectionError
 
@@ -109,6 +143,20 @@ class DiveraConfigFlow(DiveraFlow, ConfigFlow):
         """Initialize DiveraConfigFlow."""
         super().__init__()
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler.
+
+        Args:
+            config_entry (ConfigEntry): Configuration entry for Divera integration.
+
+        Returns:
+            OptionsFlow: The options flow of the config entry.
+
+        """
+        return DiveraOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None):
         """Handle the initial step.
 
@@ -267,3 +315,191 @@ class DiveraConfigFlow(DiveraFlow, ConfigFlow):
         uid = self._divera_client.get_email()
         await self.async_set_unique_id(uid)
         self._abort_if_unique_id_configured()
+
+
+class DiveraOptionsFlow(DiveraFlow, OptionsFlow):
+    """Handle the options flow for Divera integration.
+
+    This class manages the polling interval of a config entry, its per unit overrides,
+    the stale window, the depth of the alarm history and the webhook Divera can push
+    data to.
+
+    """
+
+    def __init__(self, config_entry: ConfigEntry):
+        """Initialize DiveraOptionsFlow.
+
+        Args:
+            config_entry (ConfigEntry): Configuration entry for Divera integration.
+
+        """
+        super().__init__(config_entry)
+
+    async def async_step_init(self, user_input: dict[str, Any] | None = None):
+        """Handle the initial step of the options flow.
+
+        Args:
+            user_input (dict): User input.
+
+        Returns:
+            dict: The next step or form to present to the user.
+
+        """
+        return await self.async_step_scan_interval(user_input)
+
+    async def async_step_scan_interval(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the step to configure the polling intervals.
+
+        Args:
+            user_input (dict): User input.
+
+        Returns:
+            ConfigFlowResult: The created options or the form to present to the user.
+
+        """
+        ucr_fields = self._get_ucr_fields()
+        options = self._config_entry.options
+
+        if user_input is not None:
+            if ucr_fields:
+                ucr_scan_intervals = {
+                    ucr_id: int(user_input[field])
+                    for ucr_id, field in ucr_fields.items()
+                    if user_input.get(field) is not None
+                }
+            else:
+                # The units are unknown while the entry is not loaded, so their
+                # intervals were not part of the form.
+                ucr_scan_intervals = options.get(DATA_UCR_SCAN_INTERVALS, {})
+            data = {
+                **options,
+                DATA_SCAN_INTERVAL: int(user_input[CONF_SCAN_INTERVAL]),
+                DATA_UCR_SCAN_INTERVALS: ucr_scan_intervals,
+                DATA_STALE_WINDOW: int(user_input[CONF_STALE_WINDOW]),
+                DATA_ALARM_HISTORY_DEPTH: int(user_input[CONF_ALARM_HISTORY_DEPTH]),
+            }
+            station = user_input.get(CONF_STATION)
+            if station:
+                data[DATA_STATION] = {
+                    "latitude": station["latitude"],
+                    "longitude": station["longitude"],
+                }
+            else:
+                data.pop(DATA_STATION, None)
+            alarm_groups = user_input.get(CONF_ALARM_GROUPS)
+            if alarm_groups:
+                data[DATA_ALARM_GROUPS] = list(alarm_groups)
+            else:
+                data.pop(DATA_ALARM_GROUPS, None)
+            if user_input.get(CONF_WEBHOOK):
+                data.setdefault(DATA_WEBHOOK_ID, webhook.async_generate_id())
+            else:
+                data.pop(DATA_WEBHOOK_ID, None)
+            return self.async_create_entry(data=data)
+
+        interval_selector = NumberSelector(
+            NumberSelectorConfig(
+                min=MIN_SCAN_INTERVAL,
+                max=MAX_SCAN_INTERVAL,
+                step=1,
+                unit_of_measurement="s",
+                mode=NumberSelectorMode.BOX,
+            )
+        )
+        scan_interval = options.get(DATA_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        ucr_scan_intervals = options.get(DATA_UCR_SCAN_INTERVALS, {})
+        stale_window = options.get(DATA_STALE_WINDOW, DEFAULT_STALE_WINDOW)
+        alarm_history_depth = options.get(
+            DATA_ALARM_HISTORY_DEPTH, DEFAULT_ALARM_HISTORY_DEPTH
+        )
+
+        fields: dict[Any, Any] = {
+            Required(CONF_SCAN_INTERVAL, default=scan_interval): interval_selector,
+            Required(CONF_STALE_WINDOW, default=stale_window): NumberSelector(
+                NumberSelectorConfig(
+                    min=MIN_STALE_WINDOW,
+                    max=MAX_STALE_WINDOW,
+                    step=1,
+                    unit_of_measurement="s",
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
+            Required(
+                CONF_ALARM_HISTORY_DEPTH, default=alarm_history_depth
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=MIN_ALARM_HISTORY_DEPTH,
+                    max=MAX_ALARM_HISTORY_DEPTH,
+                    step=1,
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
+            Required(
+                CONF_WEBHOOK, default=DATA_WEBHOOK_ID in options
+            ): BooleanSelector(),
+            Optional(
+                CONF_STATION,
+                description={"suggested_value": options.get(DATA_STATION)},
+            ): LocationSelector(LocationSelectorConfig(radius=False)),
+            Optional(
+                CONF_ALARM_GROUPS,
+                description={"suggested_value": options.get(DATA_ALARM_GROUPS)},
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=self._get_group_names(),
+                    multiple=True,
+                    custom_value=True,
+                )
+            ),
+        }
+        if len(ucr_fields) > 1:
+            for ucr_id, field in ucr_fields.items():
+                fields[
+                    Optional(
+                        field,
+                        description={"suggested_value": ucr_scan_intervals.get(ucr_id)},
+                    )
+                ] = interval_selector
+
+        return self.async_show_form(
+            step_id=CONF_FLOW_NAME_SCAN_INTERVAL,
+            data_schema=Schema(fields),
+            description_placeholders={"webhook_url": self._get_webhook_url()},
+        )
+
+    def _get_webhook_url(self) -> str:
+        # The address contains the secret webhook id, so it is only shown here
+        # and never logged.
+        webhook_id = self._config_entry.options.get(DATA_WEBHOOK_ID)
+        if webhook_id is None:
+            return "-"
+        try:
+            return webhook.async_generate_url(self.hass, webhook_id)
+        except NoURLAvailableError:
+            return webhook.async_generate_path(webhook_id)
+
+    def _get_ucr_fields(self) -> dict[str, str]:
+        # Fields carry the UCR id, so units with the same name get one each.
+        entry_data = self.hass.data.get(DOMAIN, {}).get(self._config_entry.entry_id)
+        if not entry_data:
+            return {}
+
+        ucr_fields: dict[str, str] = {}
+        for ucr_id in self._config_entry.data.get(DATA_UCRS, []):
+            coordinator = entry_data[ucr_id][DATA_DIVERA_COORDINATOR]
+            cluster_name = coordinator.data.get_cluster_name_from_ucr(ucr_id)
+            ucr_fields[str(ucr_id)] = f"{cluster_name} ({ucr_id})"
+        return ucr_fields
+
+    def _get_group_names(self) -> list[str]:
+        entry_data = self.hass.data.get(DOMAIN, {}).get(self._config_entry.entry_id)
+        if not entry_data:
+            return []
+
+        group_names: set[str] = set()
+        for ucr_id in self._config_entry.data.get(DATA_UCRS, []):
+            coordinator = entry_data[ucr_id][DATA_DIVERA_COORDINATOR]
+            group_names.update(coordinator.data.get_group_names())
+        return sorted(group_names)
@@ -9,27 +9,76 @@ DOMAIN: str = "divera"
 INTEGRATION_FULL_NAME: str = "Divera 24/7"
 INTEGRATION_SHORT_NAME: str = "Divera"
 DIVERA_GMBH: str = "Divera GmbH"
+GEO_LOCATION_SOURCE: str = "divera"
 
 ATTR_NAME: str = "state"
 ATTR_LATEST_UPDATE: str = "latest_update_utc"
+ATTR_STALE_SINCE: str = "stale_since"
 DIVERA_DATA: str = "divera_data"
 DATA_DIVERA_COORDINATOR: str = "divera_coordinator"
+DATA_DIVERA_FETCHER: str = "divera_fetcher"
+DATA_DIVERA_STORE: str = "divera_store"
+DATA_DIVERA_SESSIONS: str = "divera_sessions"
+DATA_DIVERA_VEHICLES: str = "divera_vehicles"
+DATA_DIVERA_STORES: str = "divera_stores"
+DATA_DIVERA_VEHICLE_COORDINATOR: str = "divera_vehicle_coordinator"
 USER_NAME: str = "user_name"
 
 DIVERA_BASE_URL: str = "https://app.divera247.com"
 DIVERA_API_PULL_PATH: str = "/api/v2/pull/all"
 DIVERA_API_STATUS_PATH: str = "/api/v2/statusgeber/set-status"
+DIVERA_API_VEHICLE_STATUS_PATH: str = "/api/v2/pull/vehicle-status"
 
 DEFAULT_SCAN_INTERVAL: int = 60
+MIN_SCAN_INTERVAL: int = 10
+MAX_SCAN_INTERVAL: int = 300
+DEFAULT_ALARM_SCAN_INTERVAL: int = 10
+DEFAULT_IDLE_SCAN_INTERVAL: int = 300
+DEFAULT_IDLE_TIMEOUT: int = 1800
+DEFAULT_MAX_BACKOFF_INTERVAL: int = 900
+DEFAULT_FETCH_TICK: int = 5
+DEFAULT_FULL_SYNC_INTERVAL: int = 3600
+DECODE_EXECUTOR_THRESHOLD: int = 256 * 1024
+DEFAULT_HOST_CONCURRENCY: int = 2
+DEFAULT_CONNECTIONS_PER_HOST: int = 4
+DEFAULT_KEEPALIVE_TIMEOUT: int = 75
+DEFAULT_DNS_CACHE_TTL: int = 300
+DEFAULT_CONNECT_TIMEOUT: int = 10
+DEFAULT_READ_TIMEOUT: int = 20
+DEFAULT_REQUEST_TIMEOUT: int = 30
+DEFAULT_FIRST_REFRESH_STAGGER: float = 0.5
+DEFAULT_ALARM_HISTORY_DEPTH: int = 10
+MIN_ALARM_HISTORY_DEPTH: int = 1
+MAX_ALARM_HISTORY_DEPTH: int = 50
+DEFAULT_SNAPSHOT_SAVE_DELAY: int = 60
+DEFAULT_STALE_WINDOW: int = 600
+DEFAULT_STATUS_WRITE_DELAY: float = 1.0
+DEFAULT_STATUS_WRITE_CONCURRENCY: int = 4
+DEFAULT_NEWS_CACHE_SIZE: int = 50
+DEFAULT_VEHICLE_SCAN_INTERVAL: int = 60
+MIN_STALE_WINDOW: int = 0
+MAX_STALE_WINDOW: int = 3600
+DEFAULT_SNAPSHOT_MAX_AGE: int = 7 * 24 * 3600
 
 DATA_ACCESSKEY: str = "accesskey"
 DATA_UCRS: str = "ucrs"
 DATA_SCAN_INTERVAL: str = "scan_interval"
+DATA_UCR_SCAN_INTERVALS: str = "ucr_scan_intervals"
+DATA_WEBHOOK_ID: str = "webhook_id"
+DATA_ALARM_HISTORY_DEPTH: str = "alarm_history_depth"
+DATA_STALE_WINDOW: str = "stale_window"
+DATA_STATION: str = "station"
+DATA_ALARM_GROUPS: str = "alarm_groups"
 DATA_BASE_URL: str = "base_url"
 
 CONF_CLUSTERS: str = "clusters"
 CONF_ACCESSKEY: str = "accesskey"
 CONF_SCAN_INTERVAL: str = "scan_interval"
+CONF_WEBHOOK: str = "webhook"
+CONF_ALARM_HISTORY_DEPTH: str = "alarm_history_depth"
+CONF_STALE_WINDOW: str = "stale_window"
+CONF_STATION: str = "station"
+CONF_ALARM_GROUPS: str = "alarm_groups"
 CONF_BASE_URL: str = "base_url"
 
 PARAM_ACCESSKEY: str = "accesskey"
@@ -40,11 +89,28 @@ PARAM_STATUSPLAN: str = "ts_statusplan"
 PARAM_LOCALMONITOR: str = "ts_localmonitor"
 PARAM_MONITOR: str = "ts_monitor"
 
+DELTA_SECTIONS: dict[str, str] = {
+    PARAM_NEWS: "news",
+    PARAM_EVENT: "events",
+    PARAM_STATUSPLAN: "statusplan",
+    PARAM_LOCALMONITOR: "localmonitor",
+    PARAM_MONITOR: "monitor",
+}
+# ts_* sections of pull/all that entities are built from; the others are skipped.
+REQUIRED_SECTIONS: frozenset[str] = frozenset({"events", "news", "statusplan"})
+
+SCHEDULER_MODE_NORMAL: str = "normal"
+SCHEDULER_MODE_ALARM: str = "alarm"
+SCHEDULER_MODE_IDLE: str = "idle"
+SCHEDULER_MODE_BACKOFF: str = "backoff"
+
 VERSION_FREE: str = "Free"
 VERSION_ALARM: str = "Alarm"
 VERSION_PRO: str = "Pro"
 VERSION_UNKNOWN: str = "Unknown"
 
+STORAGE_VERSION: int = 1
+
 CONF_FLOW_VERSION: int = 3
 CONF_FLOW_MINOR_VERSION: int = 1
 CONF_FLOW_NAME_UCR: str = "user_cluster_relation"
@@ -54,3 +120,17 @@ CONF_FLOW_NAME_SCAN_INTERVAL: str = "scan_interval"
 
 ERROR_AUTH = "authentication"
 ERROR_CONNECTION = "cannot_connect"
+
+# Names under which derived data is fingerprinted along with the data sections.
+ALARM_HISTORY: str = "alarm_history"
+MEMBER_STATUS: str = "member_status"
+ACTIVE_ALARM: str = "active_alarm"
+
+EVENT_ALARM_NEW: str = "divera_alarm_new"
+EVENT_ALARM_UPDATED: str = "divera_alarm_updated"
+EVENT_ALARM_CLOSED: str = "divera_alarm_closed"
+EVENT_NEWS_NEW: str = "divera_news_new"
+
+SERVICE_SET_STATUS: str = "set_status"
+ATTR_STATUS: str = "status"
+ATTR_CLUSTERS: str = "clusters"
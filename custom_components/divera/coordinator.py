@@ -1,23 +1,78 @@
 """Coordinator Module for Divera Integration."""
 
-from datetime import timedelta
+from datetime import datetime, timedelta
+from itertools import count
+from random import random
+from time import monotonic
+from typing import Any
 
 from aiohttp import ClientSession
 
-from custom_components.divera.const import DEFAULT_SCAN_INTERVAL, LOGGER
+from custom_components.divera.const import (
+    DEFAULT_ALARM_HISTORY_DEPTH,
+    DEFAULT_ALARM_SCAN_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_IDLE_TIMEOUT,
+    DEFAULT_MAX_BACKOFF_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STALE_WINDOW,
+    EVENT_NEWS_NEW,
+    LOGGER,
+    SCHEDULER_MODE_ALARM,
+    SCHEDULER_MODE_BACKOFF,
+    SCHEDULER_MODE_IDLE,
+    SCHEDULER_MODE_NORMAL,
+)
 from custom_components.divera.divera import (
     DiveraAuthError,
     DiveraClient,
     DiveraConnectionError,
+    DiveraError,
+    DiveraFetcher,
 )
+from custom_components.divera.store import DiveraStore
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+_GOLDEN_RATIO_FRACTION = 0.618033988749895
+_PHASE_JITTER = 0.05
+_COORDINATOR_INDEX = count()
+
+
+def _next_phase() -> float:
+    """Return the phase of a new coordinator as fraction of its interval.
+
+    Consecutive coordinators are spread by the golden ratio, which keeps any
+    number of them evenly apart, plus a small random jitter so that several
+    Home Assistant instances do not line up either.
+
+    Returns:
+        float: The phase between 0 and 1.
+
+    """
+    return (
+        next(_COORDINATOR_INDEX) * _GOLDEN_RATIO_FRACTION + random() * _PHASE_JITTER
+    ) % 1
 
 
 class DiveraCoordinator(DataUpdateCoordinator):
     """Coordinator for updating Divera data.
 
-    This coordinator manages the update process for Divera data.
+    This coordinator manages the update process for Divera data. The update
+    interval adapts to the data: it is shortened while the last alarm is open,
+    relaxed when nothing changed for a while and backed off exponentially
+    while the API cannot be reached.
+
+    Every coordinator polls at its own phase of the interval, so that several
+    UCRs and config entries do not hit the API at the same moment.
+
+    Changes of the alarms are fired as divera_alarm_new, divera_alarm_updated
+    and divera_alarm_closed events, new news as divera_news_new events.
+
+    If the API cannot be reached, the last data is kept and marked as stale
+    until the stale window passed since the last successful update. Only then
+    the update fails and the entities become unavailable.
 
     Parameters:
         DataUpdateCoordinator: The base class for data update coordinators.
@@ -31,7 +86,11 @@ class DiveraCoordinator(DataUpdateCoordinator):
         accesskey: str,
         base_url: str,
         ucr_id: str,
+        fetcher: DiveraFetcher | None = None,
         update_interval: int = DEFAULT_SCAN_INTERVAL,
+        alarm_history_depth: int = DEFAULT_ALARM_HISTORY_DEPTH,
+        store: DiveraStore | None = None,
+        stale_window: int = DEFAULT_STALE_WINDOW,
     ) -> None:
         """Initialize DiveraCoordinator.
 
@@ -41,7 +100,11 @@ class DiveraCoordinator(DataUpdateCoordinator):
             accesskey (str): Access key for accessing Divera data.
             base_url (str): Base URL for Divera API.
             ucr_id (str): Unique identifier for the organization.
+            fetcher (DiveraFetcher | None, optional): Fetcher shared by all coordinators of the accesskey. Defaults to None.
             update_interval (int | None, optional): Interval in seconds for updating data. Defaults to DEFAULT_SCAN_INTERVAL.
+            alarm_history_depth (int, optional): Number of alarms kept in the alarm history. Defaults to DEFAULT_ALARM_HISTORY_DEPTH.
+            store (DiveraStore | None, optional): Store persisting the payloads of the entry. Defaults to None.
+            stale_window (int, optional): Seconds the last data is kept while the API cannot be reached. Defaults to DEFAULT_STALE_WINDOW.
 
         """
         super().__init__(
@@ -51,15 +114,252 @@ class DiveraCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=update_interval),
         )
         self.divera_client = DiveraClient(
-            session, accesskey=accesskey, base_url=base_url, ucr_id=ucr_id
+            session,
+            accesskey=accesskey,
+            base_url=base_url,
+            ucr_id=ucr_id,
+            fetcher=fetcher,
+            alarm_history_depth=alarm_history_depth,
         )
+        self._scan_interval: int = update_interval
+        self._scheduler_mode: str = SCHEDULER_MODE_NORMAL
+        self._failures: int = 0
+        self._last_change: float = monotonic()
+        self._phase: float = _next_phase()
+        self._interval: float = update_interval
+        self._store = store
+        self._stale_window: int = stale_window
+        self._last_success: float | None = None
+        self.stale_since: datetime | None = None
 
     async def _async_update_data(self):
         try:
-            await self.divera_client.pull_data()
+            changed = await self.divera_client.pull_data()
         except DiveraAuthError as err:
             raise ConfigEntryAuthFailed from err
         except DiveraConnectionError as err:
+            self._failures += 1
+            self._adapt_update_interval()
+            if self._is_within_stale_window():
+                if self.stale_since is None:
+                    self.stale_since = dt_util.utcnow()
+                LOGGER.debug("%s keeps stale data: %s", self.name, err)
+                return self.divera_client
             raise UpdateFailed(f"Error communicating with API: {err}") from None
         else:
+            self._handle_success()
+            if changed:
+                self._handle_change()
+            self._adapt_update_interval()
+            self._fire_alarm_events()
+            self._fire_news_events()
             return self.divera_client
+
+    def _adapt_update_interval(self) -> None:
+        if self._failures:
+            mode = SCHEDULER_MODE_BACKOFF
+            seconds = min(
+                self._scan_interval * 2**self._failures, DEFAULT_MAX_BACKOFF_INTERVAL
+            )
+        elif self.divera_client.is_last_alarm_open():
+            mode = SCHEDULER_MODE_ALARM
+            seconds = min(DEFAULT_ALARM_SCAN_INTERVAL, self._scan_interval)
+        elif monotonic() - self._last_change >= DEFAULT_IDLE_TIMEOUT:
+            mode = SCHEDULER_MODE_IDLE
+            seconds = max(DEFAULT_IDLE_SCAN_INTERVAL, self._scan_interval)
+        else:
+            mode = SCHEDULER_MODE_NORMAL
+            seconds = self._scan_interval
+
+        if mode != self._scheduler_mode:
+            LOGGER.debug(
+                "%s switches from %s to %s polling every %s seconds",
+                self.name,
+                self._scheduler_mode,
+                mode,
+                seconds,
+            )
+        self._scheduler_mode = mode
+        self._interval = seconds
+        self.update_interval = timedelta(seconds=self._get_phase_delay(seconds))
+
+    def _get_phase_delay(self, seconds: float) -> float:
+        """Return the delay until the next polling slot of this coordinator.
+
+        Slots are ``seconds`` apart and shifted by the phase of the coordinator.
+        A slot closer than half an interval is skipped, so polls never come
+        faster than every half interval.
+
+        Args:
+            seconds (float): The polling interval in seconds.
+
+        Returns:
+            float: The delay in seconds.
+
+        """
+        offset = self._phase * seconds
+        delay = seconds - (self.hass.loop.time() - offset) % seconds
+        if delay < seconds / 2:
+            delay += seconds
+        return delay
+
+    async def async_handle_push(self) -> None:
+        """Publish data pushed into the fetcher without waiting for the next poll.
+
+        The pushed snapshot is picked up from the fetcher, so no request is made
+        unless it expired meanwhile. Polling continues as consistency fallback.
+
+        """
+        try:
+            changed = await self.divera_client.pull_data()
+        except DiveraError:
+            await self.async_request_refresh()
+            return
+        self._handle_success()
+        if changed:
+            self._handle_change()
+        self._adapt_update_interval()
+        self._fire_alarm_events()
+        self._fire_news_events()
+        self.async_set_updated_data(self.divera_client)
+
+    def async_restore(self, payload: dict) -> bool:
+        """Publish a persisted payload as data until the first refresh.
+
+        The restored data is marked as stale until a refresh succeeds, and the
+        stale window starts with the restore.
+
+        Args:
+            payload (dict): The persisted payload of the UCR of this coordinator.
+
+        Returns:
+            bool: True if the payload was restored, False if it is invalid.
+
+        """
+        try:
+            self.divera_client.restore(payload)
+        except ValueError as err:
+            LOGGER.warning("%s cannot restore persisted data: %s", self.name, err)
+            return False
+        self._last_success = monotonic()
+        self.stale_since = dt_util.utcnow()
+        self._adapt_update_interval()
+        self.async_set_updated_data(self.divera_client)
+        return True
+
+    def _handle_success(self) -> None:
+        self._failures = 0
+        self._last_success = monotonic()
+        self.stale_since = None
+
+    def _is_within_stale_window(self) -> bool:
+        return (
+            self.data is not None
+            and self._last_success is not None
+            and monotonic() - self._last_success < self._stale_window
+        )
+
+    def _handle_change(self) -> None:
+        self._last_change = monotonic()
+        if self._store is not None:
+            self._store.async_schedule_save()
+
+    def _fire_alarm_events(self) -> None:
+        divera = self.divera_client
+        changes = divera.pop_alarm_changes()
+        if not changes:
+            return
+        ucr_id = divera.get_active_ucr()
+        cluster_name = divera.get_cluster_name_from_ucr(ucr_id)
+        for event_type, alarm_id in changes:
+            self.hass.bus.async_fire(
+                event_type,
+                {
+                    "ucr_id": ucr_id,
+                    "cluster_name": cluster_name,
+                    **divera.get_alarm_attributes(alarm_id),
+                },
+            )
+
+    def _fire_news_events(self) -> None:
+        divera = self.divera_client
+        changes = divera.pop_news_changes()
+        if not changes:
+            return
+        ucr_id = divera.get_active_ucr()
+        cluster_name = divera.get_cluster_name_from_ucr(ucr_id)
+        for news_id in changes:
+            self.hass.bus.async_fire(
+                EVENT_NEWS_NEW,
+                {
+                    "ucr_id": ucr_id,
+                    "cluster_name": cluster_name,
+                    **divera.get_news_attributes(news_id),
+                },
+            )
+
+    def set_scan_interval(self, scan_interval: int) -> None:
+        """Set the configured polling interval and reschedule the next update.
+
+        Args:
+            scan_interval (int): Interval in seconds for updating data.
+
+        """
+        self._scan_interval = scan_interval
+        self._adapt_update_interval()
+        if self._listeners:
+            self._schedule_refresh()
+
+    def set_stale_window(self, stale_window: int) -> None:
+        """Set the seconds the last data is kept while the API cannot be reached.
+
+        Args:
+            stale_window (int): The stale window in seconds, 0 disables it.
+
+        """
+        self._stale_window = stale_window
+
+    def set_alarm_history_depth(self, depth: int) -> None:
+        """Set the number of alarms kept in the alarm history and update the entities.
+
+        Args:
+            depth (int): Maximum number of alarms.
+
+        """
+        self.divera_client.set_alarm_history_depth(depth)
+        if self.data is not None:
+            self.async_update_listeners()
+
+    def set_alarm_groups(self, group_names: list[str]) -> None:
+        """Set the groups whose alarms count as active alarms and update the entities.
+
+        Args:
+            group_names (list[str]): Names of the groups, empty for the alarms addressed
+                to the user.
+
+        """
+        self.divera_client.set_alarm_groups(group_names)
+        if self.data is not None:
+            self.async_update_listeners()
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return the state of the adaptive scheduler.
+
+        Returns:
+            dict[str, Any]: The scheduler mode, the current and configured interval,
+                the delay until the next update, the phase of the coordinator,
+                the number of consecutive failures and the seconds since the data last changed.
+
+        """
+        return {
+            "mode": self._scheduler_mode,
+            "update_interval": self._interval,
+            "next_update_delay": round(self.update_interval.total_seconds(), 3),
+            "phase": round(self._phase, 3),
+            "scan_interval": self._scan_interval,
+            "consecutive_failures": self._failures,
+            "stale_window": self._stale_window,
+            "stale_since": self.stale_since,
+            "seconds_since_last_change": round(monotonic() - self._last_change),
+            "last_update_success": self.last_update_success,
+        }
@@ -0,0 +1,53 @@
+"""Diagnostics Module for Divera Integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DATA_ACCESSKEY,
+    DATA_DIVERA_COORDINATOR,
+    DATA_DIVERA_STORE,
+    DATA_STATION,
+    DATA_UCRS,
+    DATA_WEBHOOK_ID,
+    DOMAIN,
+)
+from .coordinator import DiveraCoordinator
+from .store import DiveraStore
+
+# The title and unique id of an entry are the name and email of the user.
+TO_REDACT = {DATA_ACCESSKEY, DATA_WEBHOOK_ID, DATA_STATION, "unique_id", "title"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Args:
+        hass (HomeAssistant): Home Assistant instance.
+        entry (ConfigEntry): Configuration entry for the integration.
+
+    Returns:
+        dict[str, Any]: The redacted entry data, the scheduler state per UCR and the
+            state of the persisted data.
+
+    """
+    store: DiveraStore = hass.data[DOMAIN][entry.entry_id][DATA_DIVERA_STORE]
+    coordinators: dict[str, Any] = {}
+    for ucr_id in entry.data[DATA_UCRS]:
+        coordinator: DiveraCoordinator = hass.data[DOMAIN][entry.entry_id][ucr_id][
+            DATA_DIVERA_COORDINATOR
+        ]
+        coordinators[str(ucr_id)] = coordinator.get_diagnostics()
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "coordinators": coordinators,
+        "store": store.get_diagnostics(),
+    }
@@ -1,90 +1,617 @@
 """Divera Http Client Module for Divera Integration."""
 
+import asyncio
+from collections.abc import Callable, Iterable
 from datetime import datetime
+from http import HTTPStatus
 from http.client import UNAUTHORIZED
+from math import inf
+from time import monotonic
+from typing import Any
 
-from aiohttp import ClientError, ClientResponseError, ClientSession
+from aiohttp import ClientError, ClientResponseError, ClientSession, ClientTimeout, hdrs
+from yarl import URL
 
 from homeassistant.const import STATE_UNKNOWN
 
 from .const import (
+    ACTIVE_ALARM,
+    ALARM_HISTORY,
+    DECODE_EXECUTOR_THRESHOLD,
+    DEFAULT_ALARM_HISTORY_DEPTH,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_FETCH_TICK,
+    DEFAULT_FULL_SYNC_INTERVAL,
+    DEFAULT_HOST_CONCURRENCY,
+    DEFAULT_NEWS_CACHE_SIZE,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_REQUEST_TIMEOUT,
+    DELTA_SECTIONS,
     DIVERA_API_PULL_PATH,
     DIVERA_API_STATUS_PATH,
+    DIVERA_API_VEHICLE_STATUS_PATH,
     DIVERA_BASE_URL,
     LOGGER,
+    MEMBER_STATUS,
     PARAM_ACCESSKEY,
-    PARAM_EVENT,
-    PARAM_LOCALMONITOR,
-    PARAM_MONITOR,
-    PARAM_NEWS,
-    PARAM_STATUSPLAN,
     PARAM_UCR,
     VERSION_ALARM,
     VERSION_FREE,
     VERSION_PRO,
     VERSION_UNKNOWN,
 )
-from .utils import remove_params_from_url
+from .history import AlarmHistory
+from .intervals import IntervalIndex
+from .members import MemberStatusTally
+from .news import NewsCache
+from .snapshot import DiveraSnapshot
+from .utils import json_loads, merge_section, section_has_gaps, section_timestamp
+
+_HOST_SEMAPHORES: dict[str, asyncio.Semaphore] = {}
+# Applied to every request, so a hung request cannot stall a refresh even on
+# sessions without a default timeout.
+REQUEST_TIMEOUT = ClientTimeout(
+    total=DEFAULT_REQUEST_TIMEOUT,
+    connect=DEFAULT_CONNECT_TIMEOUT,
+    sock_read=DEFAULT_READ_TIMEOUT,
+)
 
 
-class DiveraClient:
-    """Represents a client for interacting with the Divera API."""
+def get_host_semaphore(base_url: str) -> asyncio.Semaphore:
+    """Return the semaphore limiting concurrent pull requests to a host.
+
+    Args:
+        base_url (str): Base URL of the Divera API.
+
+    Returns:
+        asyncio.Semaphore: The semaphore shared by all fetchers of the host.
+
+    """
+    host = URL(base_url).host or base_url
+    semaphore = _HOST_SEMAPHORES.get(host)
+    if semaphore is None:
+        semaphore = _HOST_SEMAPHORES[host] = asyncio.Semaphore(DEFAULT_HOST_CONCURRENCY)
+    return semaphore
+
+
+class DiveraFetcher:
+    """Shares the pull/all requests of one accesskey between several clients.
+
+    All clients of a config entry pull their data through the same fetcher.
+    Requests are keyed by their ``ucr`` parameter, so the number of HTTP
+    requests grows with the number of distinct payloads instead of the
+    number of clients asking for them. Callers that ask for a UCR while a
+    request for it is in flight, or within one tick after it finished,
+    receive the same parsed result.
+
+    In delta mode the ``ts_*`` parameters carry the newest server timestamp
+    seen per section, so the server only returns what changed. Partial
+    sections are merged into the cached ones. A full resync is done on the
+    first request, after errors, when a merged section has gaps and once
+    every full sync interval.
+
+    Requests are conditional: the ETag and Last-Modified validators of the
+    last response are sent back, and a 304 Not Modified answer keeps the
+    current snapshot without reading or parsing a body. Compressed transfer
+    is negotiated by aiohttp, which offers every encoding it can decode.
+
+    Only the ``ts_*`` sections listed in ``sections`` are requested, the
+    others are asked for as of now and dropped. Bodies are decoded with the
+    given decoder, orjson if available, and large bodies are decoded and
+    indexed in the executor to keep the event loop responsive.
+
+    At most DEFAULT_HOST_CONCURRENCY pull requests run against the same
+    host at a time, shared by all fetchers.
+    """
 
     def __init__(
-        self, session: ClientSession, accesskey, base_url=DIVERA_BASE_URL, ucr_id=None
+        self,
+        session: ClientSession,
+        accesskey: str,
+        base_url: str = DIVERA_BASE_URL,
+        tick: float = DEFAULT_FETCH_TICK,
+        delta: bool = True,
+        full_sync_interval: float = DEFAULT_FULL_SYNC_INTERVAL,
+        sections: Iterable[str] = (),
+        decoder: Callable[[bytes], Any] = json_loads,
     ) -> None:
-        """Initialize DiveraClient.
+        """Initialize DiveraFetcher.
 
         Args:
             session (ClientSession): Client session for making HTTP requests.
             accesskey (str): Access key for accessing Divera data.
             base_url (str, optional): Base URL for Divera API. Defaults to DIVERA_BASE_URL.
-            ucr_id (str, optional): Unique identifier for the organization. Defaults to None.
+            tick (float, optional): Seconds a fetched payload is shared with later callers. Defaults to DEFAULT_FETCH_TICK.
+            delta (bool, optional): Whether to request only changed sections. Defaults to True.
+            full_sync_interval (float, optional): Seconds after which a full resync is forced. Defaults to DEFAULT_FULL_SYNC_INTERVAL.
+            sections (Iterable[str], optional): Names of the ts_* sections to request, e.g. "news". Defaults to none.
+            decoder (Callable[[bytes], Any], optional): Function decoding a response body. Defaults to json_loads.
 
         """
         self.__session = session
-        self.__data = None
         self.__accesskey = accesskey
         self.__base_url = base_url
-        self.__ucr_id = ucr_id
+        self.__tick = tick
+        self.__pending: dict[str | None, asyncio.Task] = {}
+        self.__results: dict[str | None, tuple[float, DiveraSnapshot]] = {}
+        self.__delta = delta
+        self.__full_sync_interval = full_sync_interval
+        self.__synced: dict[str | None, float] = {}
+        self.__cursors: dict[str | None, dict[str, int]] = {}
+        self.__validators: dict[str | None, dict[str, str]] = {}
+        self.__decoder = decoder
+        self.__semaphore = get_host_semaphore(base_url)
+        self.__delta_sections = {
+            param: key for param, key in DELTA_SECTIONS.items() if key in set(sections)
+        }
+        self.__sections: dict[str | None, dict[str, dict]] = {}
 
-    async def pull_data(self):
-        """Pull data from the Divera API.
+    async def fetch(self, ucr_id=None) -> DiveraSnapshot:
+        """Fetch the pull/all payload for the given UCR.
+
+        Args:
+            ucr_id (int, optional): The UCR to request the data for. Defaults to None,
+                which requests the data of the active UCR.
+
+        Returns:
+            DiveraSnapshot: The snapshot of the parsed payload.
+
+        Raises:
+            DiveraConnectionError: If an error occurs while connecting to the Divera API.
+            DiveraAuthError: If authentication fails while connecting to the Divera API.
+
+        """
+        ucr_id = None if ucr_id is None else str(ucr_id)
+        result = self.__results.get(ucr_id)
+        if result is not None and monotonic() - result[0] < self.__tick:
+            return result[1]
+
+        task = self.__pending.get(ucr_id)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self.__request(ucr_id))
+            self.__pending[ucr_id] = task
+            task.add_done_callback(lambda _: self.__pending.pop(ucr_id, None))
+        return await asyncio.shield(task)
+
+    async def fetch_vehicles(self, ucr_id=None) -> list[dict]:
+        """Fetch the vehicles of the cluster of the given UCR with their FMS status.
+
+        Vehicle requests are not shared or cached by the fetcher, callers are
+        expected to fetch them once per cluster.
+
+        Args:
+            ucr_id (int, optional): A UCR of the cluster. Defaults to None, which requests
+                the vehicles of the cluster of the active UCR.
 
-        Retrieves data from the Divera API and updates the internal data store.
+        Returns:
+            list[dict]: The vehicle items.
 
         Raises:
             DiveraConnectionError: If an error occurs while connecting to the Divera API.
             DiveraAuthError: If authentication fails while connecting to the Divera API.
 
         """
+        url = "".join([self.__base_url, DIVERA_API_VEHICLE_STATUS_PATH])
+        params = {PARAM_ACCESSKEY: self.__accesskey}
+        if ucr_id is not None:
+            params[PARAM_UCR] = ucr_id
+        try:
+            async with (
+                self.__semaphore,
+                self.__session.get(
+                    url=url, params=params, timeout=REQUEST_TIMEOUT
+                ) as response,
+            ):
+                response.raise_for_status()
+                body = await response.read()
+        except ClientResponseError as exc:
+            LOGGER.error(f"Error response {exc.status} while requesting {url!r}.")
+            if exc.status == UNAUTHORIZED:
+                raise DiveraAuthError from None
+            raise DiveraConnectionError from None
+        except ClientError:
+            LOGGER.error(f"An error occurred while requesting {url!r}.")
+            raise DiveraConnectionError from None
+        except TimeoutError:
+            LOGGER.error("Timeout while requesting %s.", url)
+            raise DiveraConnectionError from None
+
+        try:
+            data = self.__decoder(body)
+        except ValueError:
+            LOGGER.error("Invalid response while requesting %s.", url)
+            raise DiveraConnectionError from None
+        vehicles = data.get("data") if isinstance(data, dict) else None
+        if not isinstance(vehicles, list):
+            LOGGER.error("Unexpected response while requesting %s.", url)
+            raise DiveraConnectionError
+        return vehicles
+
+    def invalidate(self, ucr_id=None) -> None:
+        """Expire the shared payload of the given UCR.
+
+        The next call to fetch for this UCR will issue a new unconditional
+        request. This is used after writes, so that a following refresh sees
+        the new state. The payload itself is kept for get_payloads.
+
+        Args:
+            ucr_id (int, optional): The UCR whose payload is expired. Defaults to None.
+
+        """
+        ucr_id = None if ucr_id is None else str(ucr_id)
+        result = self.__results.get(ucr_id)
+        if result is not None:
+            self.__results[ucr_id] = (-inf, result[1])
+        self.__validators.pop(ucr_id, None)
+
+    def restore(self, ucr_id, payload: dict) -> DiveraSnapshot:
+        """Seed the cache of the given UCR with a previously persisted payload.
+
+        The restored payload is expired right away, so the next call to fetch
+        still issues a full request. A payload that was already fetched is
+        kept.
+
+        Args:
+            ucr_id (int): The UCR the payload was pulled for.
+            payload (dict): The persisted payload.
+
+        Returns:
+            DiveraSnapshot: The snapshot of the cached payload.
+
+        Raises:
+            ValueError: If the payload cannot be indexed.
+
+        """
+        try:
+            snapshot = DiveraSnapshot.from_payload(payload)
+        except (AttributeError, KeyError, TypeError, ValueError) as err:
+            raise ValueError(f"Invalid payload of ucr {ucr_id}") from err
+        return self.__results.setdefault(str(ucr_id), (-inf, snapshot))[1]
+
+    def get_payloads(self) -> dict[str, dict]:
+        """Return the latest payload of every UCR, e.g. to persist them.
+
+        Returns:
+            dict[str, dict]: The payloads by UCR id.
+
+        """
+        return {
+            ucr_id: dict(snapshot.payload)
+            for ucr_id, (_, snapshot) in self.__results.items()
+            if ucr_id is not None
+        }
+
+    def push(self, payload: dict) -> list[str | None]:
+        """Merge a pushed partial payload into the cached snapshots.
+
+        The payload is either shaped like a pull/all response, with the
+        changed sections below ``data``, or a single alarm item. It is merged
+        into the snapshot of every UCR of the payload's ``cluster_id``. A
+        payload without ``cluster_id`` is only merged if a single UCR is
+        cached, as it cannot be assigned otherwise.
+        Pushed items are merged into the cached items, so fields they do not
+        carry, like ``ucr_self_addressed`` or the answers, are kept.
+
+        Args:
+            payload (dict): The pushed payload.
+
+        Returns:
+            list[str | None]: The UCRs whose snapshot was updated.
+
+        """
+        data = payload.get("data")
+        if not isinstance(data, dict):
+            if "id" not in payload:
+                return []
+            data = {
+                "alarm": {
+                    "items": {str(payload["id"]): payload},
+                    "sorting": [payload["id"]],
+                }
+            }
+
+        cluster_id = payload.get("cluster_id")
+        if cluster_id is None and len(self.__results) != 1:
+            return []
+
+        updated: list[str | None] = []
+        for ucr_id, (_, snapshot) in list(self.__results.items()):
+            active_ucr = str(snapshot.ucr_active)
+            if (
+                cluster_id is not None
+                and snapshot.ucr_cluster_ids.get(active_ucr) != cluster_id
+            ):
+                continue
+            current = snapshot.payload.get("data") or {}
+            merged = {**current}
+            for key, section in data.items():
+                merged[key] = merge_section(current.get(key), section, merge_items=True)
+            pushed = DiveraSnapshot.from_payload({**snapshot.payload, "data": merged})
+            self.__results[ucr_id] = (monotonic(), pushed)
+            self.__validators.pop(ucr_id, None)
+            updated.append(ucr_id)
+        return updated
+
+    def resync(self, ucr_id=None) -> None:
+        """Force the next request of the given UCR to be a full resync.
+
+        Args:
+            ucr_id (int, optional): The UCR to resync. Defaults to None.
+
+        """
+        ucr_id = None if ucr_id is None else str(ucr_id)
+        self.__synced.pop(ucr_id, None)
+        self.__cursors.pop(ucr_id, None)
+        self.__sections.pop(ucr_id, None)
+        self.__validators.pop(ucr_id, None)
+
+    async def __request(self, ucr_id) -> DiveraSnapshot:
         url = "".join([self.__base_url, DIVERA_API_PULL_PATH])
+        full = self.__needs_full_sync(ucr_id)
+        cursors = {} if full else self.__cursors.get(ucr_id, {})
         time = int(datetime.now().timestamp())
-        params = {
-            PARAM_ACCESSKEY: self.__accesskey,
-            PARAM_NEWS: time,
-            PARAM_EVENT: time,
-            PARAM_STATUSPLAN: time,
-            PARAM_LOCALMONITOR: time,
-            PARAM_MONITOR: time,
-        }
-        if self.__ucr_id is not None:
-            params[PARAM_UCR] = self.__ucr_id
+        params = {PARAM_ACCESSKEY: self.__accesskey}
+        for param in DELTA_SECTIONS:
+            if param in self.__delta_sections:
+                params[param] = cursors.get(param, 0)
+            else:
+                params[param] = time
+        if ucr_id is not None:
+            params[PARAM_UCR] = ucr_id
+
+        previous = self.__results.get(ucr_id)
+        headers = {}
+        if previous is not None:
+            headers.update(self.__validators.get(ucr_id, {}))
         try:
-            async with self.__session.get(url=url, params=params) as response:
+            async with (
+                self.__semaphore,
+                self.__session.get(
+                    url=url, params=params, headers=headers, timeout=REQUEST_TIMEOUT
+                ) as response,
+            ):
                 response.raise_for_status()
-                self.__data = await response.json()
+                if response.status == HTTPStatus.NOT_MODIFIED and previous is not None:
+                    if full:
+                        self.__synced[ucr_id] = monotonic()
+                    self.__results[ucr_id] = (monotonic(), previous[1])
+                    return previous[1]
+                body = await response.read()
+                self.__validators[ucr_id] = {
+                    header: response.headers[validator]
+                    for header, validator in (
+                        (hdrs.IF_NONE_MATCH, hdrs.ETAG),
+                        (hdrs.IF_MODIFIED_SINCE, hdrs.LAST_MODIFIED),
+                    )
+                    if validator in response.headers
+                }
         except ClientResponseError as exc:
-            # TODO Exception Tests
-            url = remove_params_from_url(exc.request_info.url)
+            self.resync(ucr_id)
             LOGGER.error(f"Error response {exc.status} while requesting {url!r}.")
             if exc.status == UNAUTHORIZED:
                 raise DiveraAuthError from None
             raise DiveraConnectionError from None
-        except ClientError as exc:
-            url = remove_params_from_url(exc.request_info.url)
+        except ClientError:
+            self.resync(ucr_id)
             LOGGER.error(f"An error occurred while requesting {url!r}.")
             raise DiveraConnectionError from None
+        except TimeoutError:
+            self.resync(ucr_id)
+            LOGGER.error("Timeout while requesting %s.", url)
+            raise DiveraConnectionError from None
+
+        large = len(body) >= DECODE_EXECUTOR_THRESHOLD
+        try:
+            data = await self.__run(large, self.__decoder, body)
+        except ValueError:
+            self.resync(ucr_id)
+            LOGGER.error("Invalid response while requesting %s.", url)
+            raise DiveraConnectionError from None
+        if not isinstance(data, dict):
+            self.resync(ucr_id)
+            LOGGER.error("Unexpected response while requesting %s.", url)
+            raise DiveraConnectionError
+
+        if isinstance(data.get("data"), dict):
+            for param, key in DELTA_SECTIONS.items():
+                if param not in self.__delta_sections:
+                    data["data"].pop(key, None)
+        if self.__delta:
+            data = self.__merge(ucr_id, data, full)
+        try:
+            snapshot = await self.__run(large, DiveraSnapshot.from_payload, data)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            self.resync(ucr_id)
+            LOGGER.error("Unexpected response while requesting %s.", url)
+            raise DiveraConnectionError from None
+        self.__results[ucr_id] = (monotonic(), snapshot)
+        return snapshot
+
+    @staticmethod
+    async def __run(executor: bool, func: Callable, *args):
+        if not executor:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    def __needs_full_sync(self, ucr_id) -> bool:
+        if not self.__delta:
+            return True
+        synced = self.__synced.get(ucr_id)
+        return synced is None or monotonic() - synced >= self.__full_sync_interval
+
+    def __merge(self, ucr_id, payload: dict, full: bool) -> dict:
+        data = payload.get("data")
+        if not isinstance(data, dict):
+            self.resync(ucr_id)
+            return payload
+
+        cached = {} if full else self.__sections.get(ucr_id, {})
+        previous = {} if full else self.__cursors.get(ucr_id, {})
+        sections: dict[str, dict] = {}
+        cursors: dict[str, int] = {}
+        gaps = False
+        for param, key in self.__delta_sections.items():
+            section = merge_section(cached.get(key), data.get(key))
+            if section is not None:
+                sections[key] = section
+            cursors[param] = max(previous.get(param, 0), section_timestamp(section))
+            gaps = gaps or section_has_gaps(section)
+
+        if gaps:
+            LOGGER.debug("Delta sections of ucr %s have gaps, resyncing", ucr_id)
+            self.resync(ucr_id)
+        else:
+            self.__sections[ucr_id] = sections
+            self.__cursors[ucr_id] = cursors
+            if full:
+                self.__synced[ucr_id] = monotonic()
+        return {**payload, "data": {**data, **sections}}
+
+
+class DiveraClient:
+    """Represents a client for interacting with the Divera API."""
+
+    def __init__(
+        self,
+        session: ClientSession,
+        accesskey,
+        base_url=DIVERA_BASE_URL,
+        ucr_id=None,
+        fetcher: DiveraFetcher | None = None,
+        alarm_history_depth: int = DEFAULT_ALARM_HISTORY_DEPTH,
+    ) -> None:
+        """Initialize DiveraClient.
+
+        Args:
+            session (ClientSession): Client session for making HTTP requests.
+            accesskey (str): Access key for accessing Divera data.
+            base_url (str, optional): Base URL for Divera API. Defaults to DIVERA_BASE_URL.
+            ucr_id (str, optional): Unique identifier for the organization. Defaults to None.
+            fetcher (DiveraFetcher, optional): Fetcher shared with other clients of the same
+                accesskey. Defaults to None, which creates a fetcher for this client only.
+            alarm_history_depth (int, optional): Number of alarms kept in the alarm history.
+                Defaults to DEFAULT_ALARM_HISTORY_DEPTH.
+
+        """
+        self.__session = session
+        self.__data: DiveraSnapshot | None = None
+        self.__accesskey = accesskey
+        self.__base_url = base_url
+        self.__ucr_id = ucr_id
+        if fetcher is None:
+            fetcher = DiveraFetcher(session, accesskey, base_url)
+        self.__fetcher = fetcher
+        self.__alarm_history = AlarmHistory(alarm_history_depth)
+        self.__alarm_changes: list[tuple[str, int]] = []
+        self.__member_status = MemberStatusTally()
+        self.__events = IntervalIndex(_get_item_bounds, _get_item_stamp)
+        self.__status_plan = IntervalIndex(_get_item_bounds, _get_item_stamp)
+        self.__news = NewsCache(DEFAULT_NEWS_CACHE_SIZE)
+        self.__news_changes: list[int] = []
+        self.__alarm_groups: frozenset[str] = frozenset()
+        self.__active_alarm_ids: tuple[int, ...] = ()
+        self.__active_alarm_revision = 0
+        self.__restored = False
+        self.__pull: asyncio.Task | None = None
+
+    async def pull_data(self):
+        """Pull data from the Divera API.
+
+        Retrieves data from the Divera API through the fetcher and updates the internal data store.
+        If the alarms changed, they are diffed into the alarm history. The changes are available
+        from get_alarm_changes until the next pull; the first pull, and the first one after
+        restore, only fills the history.
+        If the cluster changed, its members are applied to the member status counts,
+        and changed events and status plan entries are applied to their calendar indexes.
+        New news are available from pop_news_changes until the next pull.
+
+        Concurrent callers share one pull: callers arriving while a pull is in
+        flight await it and receive its result instead of starting another one.
+
+        Returns:
+            bool: True if the pulled data differs from the previously pulled data.
+
+        Raises:
+            DiveraConnectionError: If an error occurs while connecting to the Divera API.
+            DiveraAuthError: If authentication fails while connecting to the Divera API.
+
+        """
+        task = self.__pull
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self.__pull_data())
+            self.__pull = task
+            task.add_done_callback(self.__pull_done)
+        return await asyncio.shield(task)
+
+    async def __pull_data(self) -> bool:
+        snapshot = await self.__fetcher.fetch(self.__ucr_id)
+        return self.__apply(snapshot)
+
+    def __pull_done(self, task: asyncio.Task) -> None:
+        if self.__pull is task:
+            self.__pull = None
+        if not task.cancelled():
+            # Retrieve the exception, so a pull without waiting callers is not
+            # reported as never retrieved.
+            task.exception()
+
+    def restore(self, payload: dict) -> None:
+        """Use a previously persisted payload as data until the next pull.
+
+        Like the first pull, the restored payload only fills the alarm history and
+        the news, and the first pull after it does not report their changes either,
+        since they may have happened long ago. Alarms of the restored payload do
+        not count as active alarms until they are pulled.
+
+        Args:
+            payload (dict): The persisted payload of the UCR of this client.
+
+        Raises:
+            ValueError: If the payload cannot be indexed.
+
+        """
+        self.__apply(self.__fetcher.restore(self.__ucr_id, payload), restored=True)
+
+    def __apply(self, snapshot: DiveraSnapshot, restored: bool = False) -> bool:
+        previous = self.__data
+        notify = previous is not None and not self.__restored
+        self.__data = snapshot
+        self.__restored = restored
+        cluster_changed = previous is None or snapshot.fingerprints.get(
+            "cluster"
+        ) != previous.fingerprints.get("cluster")
+        if cluster_changed:
+            self.__member_status.update(snapshot.members)
+        if not notify or snapshot.fingerprints.get(
+            "alarm"
+        ) != previous.fingerprints.get("alarm"):
+            self.__alarm_changes = self.__alarm_history.update(
+                snapshot.alarms, snapshot.alarm_sorting, notify=notify
+            )
+            self.__update_active_alarms()
+        else:
+            self.__alarm_changes = []
+            if cluster_changed and self.__alarm_groups:
+                self.__update_active_alarms()
+        if previous is None or snapshot.fingerprints.get(
+            "news"
+        ) != previous.fingerprints.get("news"):
+            self.__news_changes = self.__news.update(
+                snapshot.news, snapshot.news_sorting, notify=notify
+            )
+        else:
+            self.__news_changes = []
+        for section, index, items in (
+            ("events", self.__events, snapshot.events),
+            ("statusplan", self.__status_plan, snapshot.status_plan),
+        ):
+            if previous is None or snapshot.fingerprints.get(
+                section
+            ) != previous.fingerprints.get(section):
+                index.update(items)
+        return previous is None or (
+            snapshot is not previous and snapshot.fingerprints != previous.fingerprints
+        )
 
     def get_base_url(self) -> str:
         """Get the base URL of the Divera API.
@@ -95,6 +622,26 @@ class DiveraClient:
         """
         return self.__base_url
 
+    def get_fingerprint(self, sections) -> tuple:
+        """Get the content fingerprints of the given sections of the pulled data.
+
+        Args:
+            sections (Iterable[str]): The names of the sections, e.g. "alarm" or "status".
+                ALARM_HISTORY, MEMBER_STATUS and ACTIVE_ALARM stand for the revisions of the
+                alarm history, the member status counts and the active alarms.
+
+        Returns:
+            tuple: The fingerprints in the order of the given sections, None for missing sections.
+
+        """
+        fingerprints = {
+            **self.__data.fingerprints,
+            ALARM_HISTORY: self.__alarm_history.revision,
+            MEMBER_STATUS: self.__member_status.revision,
+            ACTIVE_ALARM: self.__active_alarm_revision,
+        }
+        return tuple(fingerprints.get(section) for section in sections)
+
     def get_full_name(self) -> str:
         """Retrieve the full name of the user associated with the data.
 
@@ -105,8 +652,8 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        firstname = self.__data["data"]["user"]["firstname"]
-        lastname = self.__data["data"]["user"]["lastname"]
+        firstname = self.__data.user["firstname"]
+        lastname = self.__data.user["lastname"]
         return firstname + " " + lastname
 
     def get_user(self) -> dict:
@@ -121,8 +668,8 @@ class DiveraClient:
 
         """
         data = {}
-        data["firstname"] = self.__data["data"]["user"]["firstname"]
-        data["lastname"] = self.__data["data"]["user"]["lastname"]
+        data["firstname"] = self.__data.user["firstname"]
+        data["lastname"] = self.__data.user["lastname"]
         data["fullname"] = self.get_full_name()
         data["email"] = self.get_email()
         return data
@@ -141,12 +688,8 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        for state_id in self.__data["data"]["cluster"]["statussorting"]:
-            state_name = self.__data["data"]["cluster"]["status"][str(state_id)]["name"]
-            if state_name == name:
-                return state_id
         # TODO: raise Error instead of None
-        return None
+        return self.__data.status_ids.get(name)
 
     def get_all_state_name(self) -> list:
         """Return the list of all available names of the states.
@@ -158,11 +701,18 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        states = []
-        for state_id in self.__data["data"]["cluster"]["statussorting"]:
-            state_name = self.__data["data"]["cluster"]["status"][str(state_id)]["name"]
-            states.append(state_name)
-        return states
+        return list(self.__data.status_name_list)
+
+    def get_all_state_ids(self) -> list[int]:
+        """Return the ids of all available states.
+
+        Unlike their names, the ids are unique within the cluster.
+
+        Returns:
+            list[int]: The ids of the states, in the sort order of the cluster.
+
+        """
+        return list(self.__data.status_id_list)
 
     def get_user_state(self) -> str:
         """Give the name of the current status of the user.
@@ -174,7 +724,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        status_id = self.__data["data"]["status"]["status_id"]
+        status_id = self.__data.user_status["status_id"]
         return self.get_state_name_by_id(status_id)
 
     def get_state_name_by_id(self, status_id) -> str:
@@ -190,7 +740,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        return self.__data["data"]["cluster"]["status"][str(status_id)]["name"]
+        return self.__data.status_names[int(status_id)]
 
     def get_user_state_attributes(self) -> dict:
         """Return additional information of the user's state.
@@ -204,9 +754,9 @@ class DiveraClient:
 
         """
         data = {}
-        timestamp = self.__data["data"]["status"]["status_set_date"]
+        timestamp = self.__data.user_status["status_set_date"]
         data["timestamp"] = datetime.fromtimestamp(timestamp)
-        data["id"] = self.__data["data"]["status"]["status_id"]
+        data["id"] = self.__data.user_status["status_id"]
         return data
 
     def get_last_alarm_attributes(self) -> dict:
@@ -223,12 +773,24 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        sorting_list = self.__data["data"]["alarm"]["sorting"]
+        sorting_list = self.__data.alarm_sorting
         if not sorting_list:
             return {}
+        return self.get_alarm_attributes(sorting_list[0])
+
+    def get_alarm_attributes(self, alarm_id) -> dict:
+        """Return additional information of the given alarm.
 
-        last_alarm_id = sorting_list[0]
-        alarm = self.__data["data"]["alarm"]["items"].get(str(last_alarm_id), {})
+        Args:
+            alarm_id (int): The ID of the alarm.
+
+        Returns:
+            dict: A dictionary containing information about the alarm, empty if the alarm is not found.
+
+        """
+        alarm = self.__data.alarms.get(int(alarm_id), {})
+        if not alarm:
+            return {}
 
         groups = [
             self.get_group_name_by_id(group_id) for group_id in alarm.get("group", [])
@@ -250,6 +812,143 @@ class DiveraClient:
             "answered": self.get_answered_state(alarm),
         }
 
+    def get_alarm_changes(self) -> list[tuple[str, int]]:
+        """Return the alarm changes of the last pull.
+
+        Returns:
+            list[tuple[str, int]]: The event type, e.g. EVENT_ALARM_NEW, and the alarm id of
+                every alarm that appeared, changed or was closed, oldest first.
+
+        """
+        return list(self.__alarm_changes)
+
+    def pop_alarm_changes(self) -> list[tuple[str, int]]:
+        """Return the alarm changes of the last pull and forget them.
+
+        Callers sharing a pull use this to handle its changes only once.
+
+        Returns:
+            list[tuple[str, int]]: The alarm changes like get_alarm_changes.
+
+        """
+        changes = self.__alarm_changes
+        self.__alarm_changes = []
+        return changes
+
+    def get_recent_alarms(self) -> list[dict]:
+        """Return a summary of the alarms in the alarm history.
+
+        Returns:
+            list[dict]: The id, title, date, address, priority and closed state of each alarm,
+                newest first.
+
+        """
+        return [
+            {
+                "id": alarm.get("id"),
+                "title": alarm.get("title"),
+                "date": datetime.fromtimestamp(alarm["date"])
+                if alarm.get("date")
+                else None,
+                "address": alarm.get("address"),
+                "priority": alarm.get("priority"),
+                "closed": alarm.get("closed"),
+            }
+            for alarm in self.__alarm_history.get_alarms()
+        ]
+
+    def get_recent_alarm_count(self) -> int:
+        """Return the number of alarms in the alarm history.
+
+        Returns:
+            int: The number of alarms.
+
+        """
+        return len(self.__alarm_history)
+
+    def set_alarm_history_depth(self, depth: int) -> None:
+        """Set the number of alarms kept in the alarm history.
+
+        Args:
+            depth (int): Maximum number of alarms.
+
+        """
+        self.__alarm_history.resize(depth)
+
+    def set_alarm_groups(self, group_names: Iterable[str]) -> None:
+        """Set the groups whose alarms count as active alarms.
+
+        Args:
+            group_names (Iterable[str]): Names of the groups. If empty, the open alarms
+                addressed to the user count as active.
+
+        """
+        alarm_groups = frozenset(group_names)
+        if alarm_groups == self.__alarm_groups:
+            return
+        self.__alarm_groups = alarm_groups
+        if self.__data is not None:
+            self.__update_active_alarms()
+
+    def __update_active_alarms(self) -> None:
+        alarms = self.__data.alarms
+        group_ids = {
+            group_id
+            for group_id, group_name in self.__data.group_names.items()
+            if group_name in self.__alarm_groups
+        }
+        active_alarm_ids = tuple(
+            alarm_id
+            for alarm_id in self.__data.alarm_sorting
+            if (alarm := alarms.get(alarm_id)) is not None
+            and not alarm.get("closed")
+            and _is_addressed(alarm, group_ids if self.__alarm_groups else None)
+        )
+        if self.__restored:
+            # Restored alarms may have been closed long ago.
+            active_alarm_ids = ()
+        if active_alarm_ids != self.__active_alarm_ids:
+            self.__active_alarm_ids = active_alarm_ids
+            self.__active_alarm_revision += 1
+
+    def is_alarm_active(self) -> bool:
+        """Check whether there is an active alarm.
+
+        An alarm is active while it is not closed and addressed to the user, or to
+        one of the groups set with set_alarm_groups.
+
+        Returns:
+            bool: True if there is an active alarm.
+
+        """
+        return bool(self.__active_alarm_ids)
+
+    def get_active_alarm_attributes(self) -> dict:
+        """Return information about the active alarms.
+
+        Returns:
+            dict: The number of active alarms, the ids of the active alarms and the id
+                and title of the newest one.
+
+        """
+        active_alarm_ids = self.__active_alarm_ids
+        newest = active_alarm_ids[0] if active_alarm_ids else None
+        return {
+            "count": len(active_alarm_ids),
+            "alarm_ids": list(active_alarm_ids),
+            "alarm_id": newest,
+            "title": None if newest is None else self.get_alarm_title(newest),
+        }
+
+    def get_group_names(self) -> list[str]:
+        """Return the names of the groups of the cluster.
+
+        Returns:
+            list[str]: The group names.
+
+        """
+        return list(self.__data.group_names.values())
+
     def get_answered_state(self, alarm):
         """Return the state of the user who answered the alarm.
 
@@ -260,15 +959,64 @@ class DiveraClient:
             str: The state of the user who answered the alarm.
 
         """
-        answered = alarm.get("ucr_answered", {})
-        ucr_id = self.get_active_ucr()
+        ucr_id = str(self.get_active_ucr())
+        alarm_id = alarm.get("id")
+        if alarm_id in self.__data.alarms:
+            state_id = self.__data.get_alarm_answers(alarm_id).get(ucr_id)
+            if state_id is not None:
+                return self.get_state_name_by_id(state_id)
+            return "not answered"
 
+        answered = alarm.get("ucr_answered", {})
         for state_id in answered:
             answer = answered.get(state_id)
-            if str(ucr_id) in answer:
+            if ucr_id in answer:
                 return self.get_state_name_by_id(state_id)
         return "not answered"
 
+    def get_last_alarm_answer_count(self, status_id) -> int:
+        """Return the number of members who answered the last alarm with the given state.
+
+        Args:
+            status_id (int): The ID of the status.
+
+        Returns:
+            int: The number of answers, 0 if there is no alarm.
+
+        """
+        return len(self.__get_last_alarm_answers(status_id))
+
+    def get_last_alarm_responders(self, status_id) -> list[str]:
+        """Return the names of the members who answered the last alarm with the given state.
+
+        Args:
+            status_id (int): The ID of the status.
+
+        Returns:
+            list[str]: The names of the members, or their UCR ids if the members are not
+                visible to the user.
+
+        """
+        members = self.__data.members
+        names = []
+        for ucr_id in self.__get_last_alarm_answers(status_id):
+            member = members.get(str(ucr_id))
+            if member is None:
+                names.append(str(ucr_id))
+            else:
+                names.append(
+                    member.get("stdformat_name")
+                    or f"{member.get('firstname', '')} {member.get('lastname', '')}".strip()
+                )
+        return names
+
+    def __get_last_alarm_answers(self, status_id):
+        sorting_list = self.__data.alarm_sorting
+        if not sorting_list:
+            return {}
+        alarm = self.__data.alarms.get(sorting_list[0], {})
+        return (alarm.get("ucr_answered") or {}).get(str(status_id)) or {}
+
     def get_last_alarm(self) -> dict:
         """Return information of the last alarm.
 
@@ -279,13 +1027,234 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        sorting_list = self.__data["data"]["alarm"]["sorting"]
+        sorting_list = self.__data.alarm_sorting
         if sorting_list:
             last_alarm_id = sorting_list[0]
-            alarm = self.__data["data"]["alarm"]["items"].get(str(last_alarm_id), {})
+            alarm = self.__data.alarms.get(last_alarm_id, {})
             return alarm.get("title", STATE_UNKNOWN)
         return STATE_UNKNOWN
 
+    def is_last_alarm_open(self) -> bool:
+        """Check whether the last alarm exists and is not closed.
+
+        Returns:
+            bool: True if the last alarm is open, False otherwise.
+
+        """
+        sorting_list = self.__data.alarm_sorting
+        if not sorting_list:
+            return False
+        alarm = self.__data.alarms.get(sorting_list[0], {})
+        return bool(alarm) and not alarm.get("closed")
+
+    def get_alarm_title(self, alarm_id) -> str | None:
+        """Return the title of the given alarm.
+
+        Args:
+            alarm_id (int): The ID of the alarm.
+
+        Returns:
+            str | None: The title, None if the alarm is not found.
+
+        """
+        return self.__data.alarms.get(int(alarm_id), {}).get("title")
+
+    def get_open_alarm_locations(self) -> dict[int, tuple[float, float]]:
+        """Return the coordinates of the open alarms.
+
+        Returns:
+            dict[int, tuple[float, float]]: Latitude and longitude by alarm id, alarms
+                without coordinates are left out.
+
+        """
+        locations: dict[int, tuple[float, float]] = {}
+        for alarm_id, alarm in self.__data.alarms.items():
+            if alarm.get("closed"):
+                continue
+            latitude, longitude = alarm.get("lat"), alarm.get("lng")
+            try:
+                location = (float(latitude), float(longitude))
+            except (TypeError, ValueError):
+                continue
+            if location != (0.0, 0.0):
+                locations[alarm_id] = location
+        return locations
+
+    def get_member_count(self) -> int:
+        """Return the number of members of the cluster.
+
+        Returns:
+            int: The number of members, 0 if the members are not visible to the user.
+
+        """
+        return len(self.__member_status)
+
+    def get_member_count_by_state(self, status_id) -> int:
+        """Return the number of members of the cluster in the given state.
+
+        Args:
+            status_id (int): The ID of the status.
+
+        Returns:
+            int: The number of members.
+
+        """
+        return self.__member_status.get_count(int(status_id))
+
+    def get_group_member_counts_by_state(self, status_id) -> dict[str, int]:
+        """Return the number of members in the given state for each group.
+
+        Args:
+            status_id (int): The ID of the status.
+
+        Returns:
+            dict[str, int]: The number of members by group name, groups without members
+                in the state are left out.
+
+        """
+        return {
+            self.get_group_name_by_id(group_id) or str(group_id): count
+            for group_id, count in self.__member_status.get_group_counts(
+                int(status_id)
+            ).items()
+        }
+
+    def get_news_unread_count(self) -> int:
+        """Return the number of unread news among the latest news.
+
+        Returns:
+            int: The number of unread news.
+
+        """
+        return self.__news.get_unread_count()
+
+    def get_latest_news_attributes(self) -> dict:
+        """Return information about the latest news.
+
+        Returns:
+            dict: The attributes of the newest news like get_news_attributes, empty if
+                there are no news.
+
+        """
+        news = self.__news.get_news()
+        if not news:
+            return {}
+        return self.__get_news_attributes(news[0])
+
+    def get_news_attributes(self, news_id) -> dict:
+        """Return information about the given news.
+
+        Args:
+            news_id (int): The ID of the news.
+
+        Returns:
+            dict: The id, title, text, date and unread state of the news, empty if the
+                news is not among the latest news.
+
+        """
+        item = self.__news.get_item(int(news_id))
+        if item is None:
+            return {}
+        return self.__get_news_attributes(item)
+
+    def __get_news_attributes(self, item) -> dict:
+        date = item.get("ts_publish") or item.get("ts_create")
+        return {
+            "id": item.get("id"),
+            "title": item.get("title"),
+            "text": item.get("text"),
+            "date": datetime.fromtimestamp(date) if date else None,
+            "new": bool(item.get("new")),
+        }
+
+    def pop_news_changes(self) -> list[int]:
+        """Return the ids of the news that are new since the previous pull and forget them.
+
+        Returns:
+            list[int]: The news ids, oldest first.
+
+        """
+        changes = self.__news_changes
+        self.__news_changes = []
+        return changes
+
+    def get_events(self, start: int, end: int) -> list[dict]:
+        """Return the events of the cluster overlapping a time range.
+
+        Args:
+            start (int): Start of the range in seconds since the epoch.
+            end (int): End of the range in seconds since the epoch, exclusive.
+
+        Returns:
+            list[dict]: The events as returned by get_next_event, in no particular order.
+
+        """
+        return [self.__get_event(item) for item in self.__events.query(start, end)]
+
+    def get_next_event(self, at: int) -> dict | None:
+        """Return the event of the cluster in progress at a time, or else the next one.
+
+        Args:
+            at (int): The time in seconds since the epoch.
+
+        Returns:
+            dict | None: The uid, summary, description, location, start, end and all_day
+                of the event, None if there is none.
+
+        """
+        item = self.__events.get_next(at)
+        return None if item is None else self.__get_event(item)
+
+    def __get_event(self, item) -> dict:
+        start, end = _get_item_bounds(item) or (0, 0)
+        return {
+            "uid": str(item.get("id")),
+            "summary": item.get("title") or "",
+            "description": item.get("text") or None,
+            "location": item.get("address") or None,
+            "start": start,
+            "end": end,
+            "all_day": bool(item.get("fullday")),
+        }
+
+    def get_status_plan(self, start: int, end: int) -> list[dict]:
+        """Return the planned states of the user overlapping a time range.
+
+        Args:
+            start (int): Start of the range in seconds since the epoch.
+            end (int): End of the range in seconds since the epoch, exclusive.
+
+        Returns:
+            list[dict]: The planned states like get_next_event, in no particular order.
+
+        """
+        return [
+            self.__get_status_plan_entry(item)
+            for item in self.__status_plan.query(start, end)
+        ]
+
+    def get_next_status_plan(self, at: int) -> dict | None:
+        """Return the planned state of the user at a time, or else the next one.
+
+        Args:
+            at (int): The time in seconds since the epoch.
+
+        Returns:
+            dict | None: The planned state like get_next_event, with the name of the
+                state as summary, None if there is none.
+
+        """
+        item = self.__status_plan.get_next(at)
+        return None if item is None else self.__get_status_plan_entry(item)
+
+    def __get_status_plan_entry(self, item) -> dict:
+        entry = self.__get_event(item)
+        status_id = item.get("status_id")
+        if status_id is not None:
+            entry["summary"] = self.get_state_name_by_id(status_id)
+        entry["description"] = item.get("note") or item.get("text") or None
+        return entry
+
     def get_group_name_by_id(self, group_id):
         """Return the name from the given group id.
 
@@ -300,11 +1269,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        try:
-            group = self.__data["data"]["cluster"]["group"][str(group_id)]
-            return group["name"]
-        except KeyError:
-            return None
+        return self.__data.group_names.get(int(group_id))
 
     def get_default_ucr(self) -> int:
         """Retrieve the default User Cluster Relation (UCR) associated with the data.
@@ -316,7 +1281,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        return self.__data["data"]["ucr_default"]
+        return self.__data.ucr_default
 
     def get_active_ucr(self) -> int:
         """Retrieve the active User Cluster Relation (UCR) associated with the data.
@@ -328,7 +1293,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        return self.__data["data"]["ucr_active"]
+        return self.__data.ucr_active
 
     def get_default_cluster_name(self) -> str:
         """Retrieve the name of the default cluster associated with the data.
@@ -365,12 +1330,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        ucr_ids = list(self.__data["data"]["ucr"])
-        cluster_names = []
-        for ucr_id in ucr_ids:
-            ucr_name = self.get_cluster_name_from_ucr(ucr_id)
-            cluster_names.append(ucr_name)
-        return cluster_names
+        return list(self.__data.ucr_names.values())
 
     def get_all_ucrs(self) -> list:
         """Retrieve a list of all User Cluster Relations (UCRs) associated with the data.
@@ -382,7 +1342,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        return list(self.__data["data"]["ucr"])
+        return list(self.__data.ucr_names)
 
     def get_cluster_names_from_ucrs(self, ucr_ids: list[int]) -> list[str]:
         """Get cluster names from a list of UCR IDs.
@@ -409,7 +1369,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        return self.__data["data"]["ucr"][str(ucr_id)]["name"]
+        return self.__data.ucr_names[str(ucr_id)]
 
     def get_cluster_id_from_ucr(self, ucr_id) -> int:
         """Retrieve the ID of the cluster associated with the given User Cluster Relation (UCR) ID.
@@ -424,7 +1384,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        return self.__data["data"]["ucr"][str(ucr_id)]["cluster_id"]
+        return self.__data.ucr_cluster_ids[str(ucr_id)]
 
     def get_ucr_ids(self, ucr_names) -> list:
         """Retrieve the IDs of User Cluster Relations (UCRs) associated with the given names.
@@ -439,13 +1399,12 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        ucr_ids = list(self.__data["data"]["ucr"])
-        ucr_name_ids = []
-        for ucr_id in ucr_ids:
-            ucr_name = self.get_cluster_name_from_ucr(ucr_id)
-            if ucr_name in ucr_names:
-                ucr_name_ids.append(ucr_id)
-        return ucr_name_ids
+        ucr_ids_by_name = self.__data.ucr_ids_by_name
+        return [
+            ucr_id
+            for ucr_name in dict.fromkeys(ucr_names)
+            for ucr_id in ucr_ids_by_name.get(ucr_name, ())
+        ]
 
     def get_accesskey(self) -> str:
         """Retrieve the access key of the user associated with the data.
@@ -457,7 +1416,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        return self.__data["data"]["user"]["accesskey"]
+        return self.__data.user["accesskey"]
 
     def get_email(self) -> str:
         """Retrieve the email of the user associated with the data.
@@ -469,7 +1428,7 @@ class DiveraClient:
             KeyError: If the required keys are not found in the data dictionary.
 
         """
-        return self.__data["data"]["user"]["email"]
+        return self.__data.user["email"]
 
     async def set_user_state_by_id(self, state_id: int):
         """Set the state of the user to the given id."""
@@ -481,21 +1440,21 @@ class DiveraClient:
 
         try:
             async with self.__session.post(
-                url=url, params=params, json=state
+                url=url, params=params, json=state, timeout=REQUEST_TIMEOUT
             ) as response:
                 response.raise_for_status()
-        except ClientError as exc:
-            url = remove_params_from_url(exc.request.url)
-            LOGGER.error(f"An error occurred while requesting {url!r}.")
-            raise DiveraConnectionError from None
+            self.__fetcher.invalidate(self.__ucr_id)
         except ClientResponseError as exc:
-            url = remove_params_from_url(exc.request.url)
-            LOGGER.error(
-                f"Error response {exc.response.status_code} while requesting {url!r}."
-            )
-            if exc.response.status_code == UNAUTHORIZED:
+            LOGGER.error(f"Error response {exc.status} while requesting {url!r}.")
+            if exc.status == UNAUTHORIZED:
                 raise DiveraAuthError from None
             raise DiveraConnectionError from None
+        except ClientError:
+            LOGGER.error(f"An error occurred while requesting {url!r}.")
+            raise DiveraConnectionError from None
+        except TimeoutError:
+            LOGGER.error("Timeout while requesting %s.", url)
+            raise DiveraConnectionError from None
 
     def get_cluster_version(self) -> str:
         """Retrieve the version of the cluster.
@@ -511,7 +1470,7 @@ class DiveraClient:
             The version_id is extracted from the 'data' dictionary attribute of the instance.
 
         """
-        version = self.__data["data"]["cluster"]["version_id"]
+        version = self.__data.cluster_version_id
         match version:
             case 1:
                 return VERSION_FREE
@@ -533,6 +1492,57 @@ class DiveraClient:
         await self.set_user_state_by_id(sid)
 
 
+def _is_addressed(alarm, group_ids: set[int] | None) -> bool:
+    """Check whether an alarm is addressed to the user or to one of some groups.
+
+    Args:
+        alarm (dict): The alarm item.
+        group_ids (set[int] | None): IDs of the groups, None for the user.
+
+    Returns:
+        bool: True if the alarm is addressed to them.
+
+    """
+    if group_ids is None:
+        return bool(alarm.get("ucr_self_addressed"))
+    return any(int(group_id) in group_ids for group_id in alarm.get("group") or ())
+
+
+def _get_item_bounds(item) -> tuple[int, int] | None:
+    """Return the time span of an event or status plan item.
+
+    Args:
+        item (Mapping[str, Any]): The item of the events or statusplan section.
+
+    Returns:
+        tuple[int, int] | None: Start and end in seconds since the epoch, None if the
+            item has no start.
+
+    """
+    start = item.get("start", item.get("ts_start"))
+    end = item.get("end", item.get("ts_end"))
+    try:
+        start = int(start)
+        end = int(end) if end else start
+    except (TypeError, ValueError):
+        return None
+    return start, max(start, end)
+
+
+def _get_item_stamp(item):
+    """Return a value that changes whenever an event or status plan item changes.
+
+    Args:
+        item (Mapping[str, Any]): The item of the events or statusplan section.
+
+    Returns:
+        Any: The update timestamp of the item, the item itself if it has none.
+
+    """
+    ts_update = item.get("ts_update")
+    return item if ts_update is None else ts_update
+
+
 class DiveraError(Exception):
     """Base class for Divera-related exceptions."""
 
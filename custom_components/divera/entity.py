@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, MutableMapping
+from collections.abc import Callable, Mapping, MutableMapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -11,7 +11,7 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DIVERA_BASE_URL, DIVERA_GMBH, DOMAIN
+from .const import ATTR_STALE_SINCE, DIVERA_BASE_URL, DIVERA_GMBH, DOMAIN
 from .coordinator import DiveraCoordinator
 from .divera import DiveraClient
 
@@ -24,15 +24,23 @@ class DiveraEntityDescription(EntityDescription):
         attribute_fn (Callable[[DiveraClient], MutableMapping[str, Any]]):
             Function that returns a mapping of attributes for the entity,
             based on a DiveraClient instance.
+        sections (tuple[str, ...]):
+            Sections of the pulled data the entity is computed from. The entity
+            is only updated when one of them changed. An empty tuple updates the
+            entity on every refresh.
 
     """
 
     attribute_fn: Callable[[DiveraClient], MutableMapping[str, Any]]
+    sections: tuple[str, ...] = ()
 
 
 class DiveraEntity(CoordinatorEntity[DiveraCoordinator]):
     """Represents a Divera entity.
 
+    While the coordinator keeps stale data, the entity carries the time the
+    data became stale as stale_since attribute.
+
     Attributes:
         entity_description (DiveraEntityDescription):
             Description of the entity.
@@ -68,16 +76,48 @@ class DiveraEntity(CoordinatorEntity[DiveraCoordinator]):
             ]
         )
 
+        self._fingerprint = self.coordinator.data.get_fingerprint(description.sections)
+        self._last_available = self.available
+        self._last_stale_since = self.coordinator.stale_since
         self._divera_update()
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._divera_update()
+        available = self.available
+        if available and self.entity_description.sections:
+            fingerprint = self.coordinator.data.get_fingerprint(
+                self.entity_description.sections
+            )
+            if (
+                fingerprint == self._fingerprint
+                and self._last_available
+                and self.coordinator.stale_since == self._last_stale_since
+            ):
+                return
+            self._fingerprint = fingerprint
+        self._last_available = available
+        self._last_stale_since = self.coordinator.stale_since
+        if available:
+            self._divera_update()
         self.async_write_ha_state()
 
     def _divera_update(self) -> None:
         raise NotImplementedError
 
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        """Return the attributes of the entity and the staleness of its data.
+
+        Returns:
+            Mapping[str, Any] | None: The attributes.
+
+        """
+        attributes = super().extra_state_attributes
+        stale_since = self.coordinator.stale_since
+        if stale_since is None:
+            return attributes
+        return {**(attributes or {}), ATTR_STALE_SINCE: stale_since}
+
     @property
     def device_info(self) -> DeviceInfo:
         """Device information property.
@@ -0,0 +1,217 @@
+"""Geo Location Module for Divera Integration."""
+
+from __future__ import annotations
+
+from homeassistant.components.geo_location import GeolocationEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfLength
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import location as location_util
+
+from .const import (
+    DATA_DIVERA_COORDINATOR,
+    DATA_STATION,
+    DATA_UCRS,
+    DOMAIN,
+    GEO_LOCATION_SOURCE,
+)
+from .coordinator import DiveraCoordinator
+from .utils import get_bearing
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Divera geo location events for the open alarms.
+
+    Args:
+        hass (HomeAssistant): Home Assistant instance.
+        entry (ConfigEntry): Configuration entry for the integration.
+        async_add_entities (AddEntitiesCallback): Function to add entities.
+
+    """
+    for ucr_id in entry.data[DATA_UCRS]:
+        coordinator = hass.data[DOMAIN][entry.entry_id][ucr_id][DATA_DIVERA_COORDINATOR]
+        manager = DiveraGeolocationManager(hass, entry, coordinator, async_add_entities)
+        entry.async_on_unload(coordinator.async_add_listener(manager.async_update))
+        manager.async_update()
+
+
+def get_reference(hass: HomeAssistant, entry: ConfigEntry) -> tuple[float, float]:
+    """Return the location distances of alarms are measured from.
+
+    Args:
+        hass (HomeAssistant): Home Assistant instance.
+        entry (ConfigEntry): Configuration entry for the integration.
+
+    Returns:
+        tuple[float, float]: Latitude and longitude of the configured station, or of
+            the home zone if no station is configured.
+
+    """
+    station = entry.options.get(DATA_STATION)
+    if station:
+        return station["latitude"], station["longitude"]
+    return hass.config.latitude, hass.config.longitude
+
+
+class DiveraGeolocationManager:
+    """Keeps a geo location event for every open alarm with coordinates of a UCR.
+
+    Events are added when an alarm appears and removed when it is closed or
+    leaves the data. The open alarms are only looked up again when the
+    alarms of the UCR changed.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinator: DiveraCoordinator,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Initialize DiveraGeolocationManager.
+
+        Args:
+            hass (HomeAssistant): Home Assistant instance.
+            entry (ConfigEntry): Configuration entry for the integration.
+            coordinator (DiveraCoordinator): The coordinator of the UCR.
+            async_add_entities (AddEntitiesCallback): Function to add entities.
+
+        """
+        self._hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._async_add_entities = async_add_entities
+        self._events: dict[int, DiveraAlarmGeolocationEvent] = {}
+        self._fingerprint: tuple | None = None
+        self._reference: tuple[float, float] | None = None
+
+    @callback
+    def async_update(self) -> None:
+        """Add, update and remove the events after an update of the coordinator."""
+        divera = self._coordinator.data
+        if divera is None:
+            return
+        fingerprint = divera.get_fingerprint(("alarm",))
+        reference = get_reference(self._hass, self._entry)
+        if fingerprint == self._fingerprint and reference == self._reference:
+            return
+        self._fingerprint = fingerprint
+        self._reference = reference
+
+        locations = divera.get_open_alarm_locations()
+        for alarm_id in self._events.keys() - locations.keys():
+            event = self._events.pop(alarm_id)
+            if event.hass is not None:
+                self._hass.async_create_task(event.async_remove(force_remove=True))
+
+        new_events: list[DiveraAlarmGeolocationEvent] = []
+        for alarm_id, location in locations.items():
+            attributes = {
+                "title": divera.get_alarm_title(alarm_id),
+                **divera.get_alarm_attributes(alarm_id),
+            }
+            event = self._events.get(alarm_id)
+            if event is None:
+                event = self._events[alarm_id] = DiveraAlarmGeolocationEvent(
+                    alarm_id, location, reference, attributes
+                )
+                new_events.append(event)
+            elif (
+                event.async_update_alarm(location, reference, attributes)
+                and event.hass is not None
+            ):
+                event.async_write_ha_state()
+        if new_events:
+            self._async_add_entities(new_events)
+
+
+class DiveraAlarmGeolocationEvent(GeolocationEvent):
+    """Represents the location of an open alarm.
+
+    The distance and bearing from the reference location are computed when
+    the alarm appears and kept until its coordinates or the reference
+    location change.
+    """
+
+    _attr_should_poll = False
+    _attr_source = GEO_LOCATION_SOURCE
+    _attr_unit_of_measurement = UnitOfLength.KILOMETERS
+    _attr_icon = "mdi:alarm-light"
+
+    def __init__(
+        self,
+        alarm_id: int,
+        location: tuple[float, float],
+        reference: tuple[float, float],
+        attributes: dict,
+    ) -> None:
+        """Initialize DiveraAlarmGeolocationEvent.
+
+        Args:
+            alarm_id (int): The ID of the alarm.
+            location (tuple[float, float]): Latitude and longitude of the alarm.
+            reference (tuple[float, float]): Latitude and longitude distances are measured from.
+            attributes (dict): The attributes of the alarm.
+
+        """
+        self._alarm_id = alarm_id
+        self._location: tuple[float, float] | None = None
+        self._reference: tuple[float, float] | None = None
+        self._bearing: float | None = None
+        self._alarm_attributes: dict = {}
+        self.async_update_alarm(location, reference, attributes)
+
+    @callback
+    def async_update_alarm(
+        self,
+        location: tuple[float, float],
+        reference: tuple[float, float],
+        attributes: dict,
+    ) -> bool:
+        """Apply the current data of the alarm.
+
+        Args:
+            location (tuple[float, float]): Latitude and longitude of the alarm.
+            reference (tuple[float, float]): Latitude and longitude distances are measured from.
+            attributes (dict): The attributes of the alarm.
+
+        Returns:
+            bool: True if the state or the attributes of the event changed.
+
+        """
+        changed = attributes != self._alarm_attributes
+        self._alarm_attributes = attributes
+        self._attr_name = attributes.get("title") or f"Alarm {self._alarm_id}"
+        if location != self._location or reference != self._reference:
+            self._location = location
+            self._reference = reference
+            self._attr_latitude, self._attr_longitude = location
+            distance = location_util.distance(*reference, *location)
+            self._attr_distance = (
+                None if distance is None else round(distance / 1000, 2)
+            )
+            self._bearing = round(get_bearing(*reference, *location))
+            changed = True
+        return changed
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the bearing from the reference location and the alarm details.
+
+        Returns:
+            dict: The attributes.
+
+        """
+        return {
+            "alarm_id": self._alarm_id,
+            "bearing": self._bearing,
+            "text": self._alarm_attributes.get("text"),
+            "address": self._alarm_attributes.get("address"),
+            "date": self._alarm_attributes.get("date"),
+            "groups": self._alarm_attributes.get("groups"),
+        }
@@ -0,0 +1,119 @@
+"""Alarm History Module for Divera Integration."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Mapping, Sequence
+from itertools import islice
+from typing import Any
+
+from .const import EVENT_ALARM_CLOSED, EVENT_ALARM_NEW, EVENT_ALARM_UPDATED
+
+
+class AlarmHistory:
+    """Bounded history of the alarms of one UCR.
+
+    The history keeps the most recent alarms in a ring buffer, so alarms that
+    left the payload or were pushed out of ``sorting[0]`` by a newer one within
+    the same poll are not lost. Each payload is diffed against the previous
+    one by alarm id, using ``ts_update`` and ``closed`` as change stamp, and
+    the resulting changes are returned as event types.
+
+    Attributes:
+        revision (int): Counter increased whenever the content of the history changes.
+
+    """
+
+    def __init__(self, depth: int) -> None:
+        """Initialize AlarmHistory.
+
+        Args:
+            depth (int): Maximum number of alarms kept in the history.
+
+        """
+        self.revision = 0
+        self.__ring: deque[int] = deque(maxlen=depth)
+        self.__alarms: dict[int, Mapping[str, Any]] = {}
+        self.__stamps: dict[int, tuple[Any, bool]] = {}
+
+    def resize(self, depth: int) -> None:
+        """Change the number of alarms kept in the history.
+
+        The newest alarms are kept if the history shrinks.
+
+        Args:
+            depth (int): Maximum number of alarms kept in the history.
+
+        """
+        if depth == self.__ring.maxlen:
+            return
+        self.__ring = deque(islice(self.__ring, depth), maxlen=depth)
+        for alarm_id in set(self.__alarms).difference(self.__ring):
+            del self.__alarms[alarm_id]
+        self.revision += 1
+
+    def update(
+        self,
+        alarms: Mapping[int, Mapping[str, Any]],
+        sorting: Sequence[int],
+        notify: bool = True,
+    ) -> list[tuple[str, int]]:
+        """Diff the alarms of a payload against the known alarms.
+
+        Alarms are processed from oldest to newest, so that several new alarms
+        of one payload end up in the history in their original order.
+
+        Args:
+            alarms (Mapping[int, Mapping[str, Any]]): Alarm items by alarm id.
+            sorting (Sequence[int]): Alarm ids, newest first.
+            notify (bool, optional): Whether changes are returned. Defaults to True,
+                False only fills the history, e.g. with the first payload.
+
+        Returns:
+            list[tuple[str, int]]: The event type and alarm id of every change.
+
+        """
+        changes: list[tuple[str, int]] = []
+        for alarm_id in reversed(sorting):
+            alarm = alarms.get(alarm_id)
+            if alarm is None:
+                continue
+            stamp = (alarm.get("ts_update"), bool(alarm.get("closed")))
+            known = self.__stamps.get(alarm_id)
+            if known == stamp:
+                continue
+            self.__stamps[alarm_id] = stamp
+
+            if known is None:
+                event_type = EVENT_ALARM_NEW
+                if alarm_id not in self.__alarms:
+                    if len(self.__ring) == self.__ring.maxlen:
+                        self.__alarms.pop(self.__ring.pop(), None)
+                    self.__ring.appendleft(alarm_id)
+            elif stamp[1] and not known[1]:
+                event_type = EVENT_ALARM_CLOSED
+            else:
+                event_type = EVENT_ALARM_UPDATED
+            if known is None or alarm_id in self.__alarms:
+                self.__alarms[alarm_id] = alarm
+            changes.append((event_type, alarm_id))
+
+        if changes:
+            self.revision += 1
+            if len(self.__stamps) > len(alarms) + len(self.__ring):
+                for alarm_id in set(self.__stamps).difference(alarms, self.__ring):
+                    del self.__stamps[alarm_id]
+        return changes if notify else []
+
+    def get_alarms(self) -> list[Mapping[str, Any]]:
+        """Return the alarms of the history.
+
+        Returns:
+            list[Mapping[str, Any]]: The alarm items, newest first.
+
+        """
+        return [self.__alarms[alarm_id] for alarm_id in self.__ring]
+
+    def __len__(self) -> int:
+        """Return the number of alarms in the history."""
+        return len(self.__ring)
@@ -0,0 +1,212 @@
+"""Interval Index Module for Divera Integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Callable, Hashable, Mapping
+from typing import Any, NamedTuple
+
+
+class Interval(NamedTuple):
+    """A half-open time span ``[start, end)`` of an item in seconds since the epoch."""
+
+    start: int
+    end: int
+    key: Hashable
+
+
+class _Node(NamedTuple):
+    center: int
+    by_start: list[Interval]
+    by_end: list[Interval]
+    left: _Node | None
+    right: _Node | None
+
+
+class IntervalIndex:
+    """Index of the time spans of items for range queries.
+
+    The items are kept by key together with a change stamp, so a new payload
+    only replaces the items whose stamp changed. The spans are organised in
+    a centered interval tree, which is rebuilt on the first query after a
+    change. A query for the items overlapping a range then takes
+    O(log n + k) for k matching items instead of a scan over all items.
+
+    Attributes:
+        revision (int): Counter increased whenever the indexed items change.
+
+    """
+
+    def __init__(
+        self,
+        bounds_fn: Callable[[Mapping[str, Any]], tuple[int, int] | None],
+        stamp_fn: Callable[[Mapping[str, Any]], Any],
+    ) -> None:
+        """Initialize IntervalIndex.
+
+        Args:
+            bounds_fn (Callable[[Mapping[str, Any]], tuple[int, int] | None]):
+                Function returning the start and end of an item, None if it has no span.
+            stamp_fn (Callable[[Mapping[str, Any]], Any]): Function returning a value
+                that changes whenever the item changes.
+
+        """
+        self.revision = 0
+        self.__bounds_fn = bounds_fn
+        self.__stamp_fn = stamp_fn
+        self.__items: dict[Hashable, Mapping[str, Any]] = {}
+        self.__stamps: dict[Hashable, Any] = {}
+        self.__intervals: dict[Hashable, Interval] = {}
+        self.__tree: _Node | None = None
+        self.__starts: list[int] = []
+        self.__sorted: list[Interval] = []
+        self.__dirty = False
+
+    def update(self, items: Mapping[Hashable, Mapping[str, Any]]) -> bool:
+        """Apply the items of a payload to the index.
+
+        Args:
+            items (Mapping[Hashable, Mapping[str, Any]]): The items by key.
+
+        Returns:
+            bool: True if an item was added, changed or removed.
+
+        """
+        changed = False
+        for key, item in items.items():
+            stamp = self.__stamp_fn(item)
+            if key in self.__stamps and self.__stamps[key] == stamp:
+                continue
+            self.__stamps[key] = stamp
+            self.__items[key] = item
+            bounds = self.__bounds_fn(item)
+            if bounds is None:
+                self.__intervals.pop(key, None)
+            else:
+                start, end = bounds
+                self.__intervals[key] = Interval(start, max(end, start + 1), key)
+            changed = True
+
+        if len(self.__items) != len(items):
+            for key in self.__items.keys() - items.keys():
+                del self.__items[key]
+                del self.__stamps[key]
+                self.__intervals.pop(key, None)
+            changed = True
+
+        if changed:
+            self.revision += 1
+            self.__dirty = True
+        return changed
+
+    def query(self, start: int, end: int) -> list[Mapping[str, Any]]:
+        """Return the items overlapping a range.
+
+        Args:
+            start (int): Start of the range in seconds since the epoch.
+            end (int): End of the range in seconds since the epoch, exclusive.
+
+        Returns:
+            list[Mapping[str, Any]]: The items, in no particular order.
+
+        """
+        self.__build()
+        result: list[Interval] = []
+        node = self.__tree
+        stack = [node] if node is not None else []
+        while stack:
+            node = stack.pop()
+            if start <= node.center < end:
+                result.extend(node.by_start)
+                if node.left is not None:
+                    stack.append(node.left)
+                if node.right is not None:
+                    stack.append(node.right)
+            elif node.center < start:
+                for interval in node.by_end:
+                    if interval.end <= start:
+                        break
+                    result.append(interval)
+                if node.right is not None:
+                    stack.append(node.right)
+            else:
+                for interval in node.by_start:
+                    if interval.start >= end:
+                        break
+                    result.append(interval)
+                if node.left is not None:
+                    stack.append(node.left)
+        return [self.__items[interval.key] for interval in result]
+
+    def get_next(self, at: int) -> Mapping[str, Any] | None:
+        """Return the item in progress at a time, or else the next one to start.
+
+        Args:
+            at (int): The time in seconds since the epoch.
+
+        Returns:
+            Mapping[str, Any] | None: The item in progress that started first, or the
+                first item starting after the time, None if there is none.
+
+        """
+        self.__build()
+        current = self.query(at, at + 1)
+        if current:
+            return min(current, key=self.__start_of)
+        index = bisect_right(self.__starts, at)
+        if index == len(self.__sorted):
+            return None
+        return self.__items[self.__sorted[index].key]
+
+    def __len__(self) -> int:
+        """Return the number of items with a time span."""
+        return len(self.__intervals)
+
+    def __start_of(self, item: Mapping[str, Any]) -> int:
+        bounds = self.__bounds_fn(item)
+        return bounds[0] if bounds is not None else 0
+
+    def __build(self) -> None:
+        if not self.__dirty:
+            return
+        self.__sorted = sorted(self.__intervals.values())
+        self.__starts = [interval.start for interval in self.__sorted]
+        self.__tree = _build_node(self.__sorted)
+        self.__dirty = False
+
+
+def _build_node(intervals: list[Interval]) -> _Node | None:
+    """Build a subtree of the interval tree.
+
+    Args:
+        intervals (list[Interval]): The intervals of the subtree, sorted by start.
+
+    Returns:
+        _Node | None: The root of the subtree, None if there are no intervals.
+
+    """
+    if not intervals:
+        return None
+    endpoints = sorted(
+        point for interval in intervals for point in (interval.start, interval.end)
+    )
+    # The lower median keeps at least the interval it belongs to at this
+    # node, so both subtrees are smaller than this one.
+    center = endpoints[(len(endpoints) - 1) // 2]
+    left: list[Interval] = []
+    right: list[Interval] = []
+    overlapping: list[Interval] = []
+    for interval in intervals:
+        if interval.end <= center:
+            left.append(interval)
+        elif interval.start > center:
+            right.append(interval)
+        else:
+            overlapping.append(interval)
+    return _Node(
+        center=center,
+        by_start=overlapping,
+        by_end=sorted(overlapping, key=lambda interval: interval.end, reverse=True),
+        left=_build_node(left),
+        right=_build_node(right),
+    )
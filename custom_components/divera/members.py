@@ -0,0 +1,106 @@
+"""Member Status Module for Divera Integration."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Mapping
+from typing import Any
+
+
+class MemberStatusTally:
+    """Counts of the members of a cluster by status, kept up to date incrementally.
+
+    The status and groups of every member are remembered, so a new payload
+    only moves the members whose status or groups changed between the
+    counters instead of counting all members again.
+
+    Attributes:
+        revision (int): Counter increased whenever a count changes.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize MemberStatusTally."""
+        self.revision = 0
+        self.__members: dict[str, tuple[int | None, tuple[int, ...]]] = {}
+        self.__counts: Counter[int] = Counter()
+        self.__group_counts: dict[int, Counter[int]] = {}
+
+    def update(self, members: Mapping[str, Mapping[str, Any]]) -> bool:
+        """Apply the members of a payload to the counters.
+
+        Args:
+            members (Mapping[str, Mapping[str, Any]]): Member items of the cluster by id.
+
+        Returns:
+            bool: True if a count changed.
+
+        """
+        known = self.__members
+        changed = False
+        for member_id, member in members.items():
+            status_id = member.get("status_id")
+            entry = (
+                None if status_id is None else int(status_id),
+                tuple(int(group_id) for group_id in member.get("group") or ()),
+            )
+            previous = known.get(member_id)
+            if previous == entry:
+                continue
+            if previous is not None:
+                self.__count(previous, -1)
+            self.__count(entry, 1)
+            known[member_id] = entry
+            changed = True
+
+        # Every member of the payload is known now, so the sizes only differ
+        # if members were removed.
+        if len(known) != len(members):
+            for member_id in known.keys() - members.keys():
+                self.__count(known.pop(member_id), -1)
+            changed = True
+
+        if changed:
+            self.revision += 1
+        return changed
+
+    def __count(self, entry: tuple[int | None, tuple[int, ...]], delta: int) -> None:
+        status_id, group_ids = entry
+        if status_id is None:
+            return
+        self.__counts[status_id] += delta
+        if not self.__counts[status_id]:
+            del self.__counts[status_id]
+        group_counts = self.__group_counts.setdefault(status_id, Counter())
+        for group_id in group_ids:
+            group_counts[group_id] += delta
+            if not group_counts[group_id]:
+                del group_counts[group_id]
+
+    def get_count(self, status_id: int) -> int:
+        """Return the number of members in the given status.
+
+        Args:
+            status_id (int): The ID of the status.
+
+        Returns:
+            int: The number of members.
+
+        """
+        return self.__counts.get(status_id, 0)
+
+    def get_group_counts(self, status_id: int) -> dict[int, int]:
+        """Return the number of members in the given status by group.
+
+        Args:
+            status_id (int): The ID of the status.
+
+        Returns:
+            dict[int, int]: The number of members by group id, groups without members are left out.
+
+        """
+        return dict(self.__group_counts.get(status_id, {}))
+
+    def __len__(self) -> int:
+        """Return the number of members."""
+        return len(self.__members)
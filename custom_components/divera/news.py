@@ -0,0 +1,124 @@
+"""News Module for Divera Integration."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from itertools import islice
+from typing import Any
+
+
+class NewsCache:
+    """Bounded cache of the latest news of one UCR.
+
+    Only the newest ``size`` news of a payload are looked at, so the work of
+    a refresh does not grow with the news history of the cluster. The cache
+    is a least recently used map keyed by news id. An item is only processed
+    again if its change stamp, ``ts_update`` and the unread flag ``new``,
+    differs from the cached one.
+
+    Attributes:
+        revision (int): Counter increased whenever the content of the cache changes.
+
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize NewsCache.
+
+        Args:
+            size (int): Number of news kept in the cache.
+
+        """
+        self.revision = 0
+        self.__size = size
+        self.__entries: OrderedDict[int, tuple[tuple[Any, bool], Mapping[str, Any]]] = (
+            OrderedDict()
+        )
+        self.__latest: list[int] = []
+        self.__newest_create = 0
+
+    def update(
+        self,
+        items: Mapping[int, Mapping[str, Any]],
+        sorting: Sequence[int],
+        notify: bool = True,
+    ) -> list[int]:
+        """Apply the news of a payload to the cache.
+
+        Args:
+            items (Mapping[int, Mapping[str, Any]]): News items by news id.
+            sorting (Sequence[int]): News ids, newest first.
+            notify (bool, optional): Whether new news are returned. Defaults to True,
+                False only fills the cache, e.g. with the first payload.
+
+        Returns:
+            list[int]: The ids of news that were not seen before, oldest first.
+
+        """
+        entries = self.__entries
+        latest = [
+            news_id for news_id in islice(sorting, self.__size) if news_id in items
+        ]
+        newest_create = self.__newest_create
+        new: list[int] = []
+        changed = latest != self.__latest
+        for news_id in reversed(latest):
+            item = items[news_id]
+            stamp = (item.get("ts_update"), bool(item.get("new")))
+            entry = entries.get(news_id)
+            if entry is not None:
+                entries.move_to_end(news_id)
+                if entry[0] == stamp:
+                    continue
+            else:
+                ts_create = item.get("ts_create") or 0
+                # News that move up into the window after newer ones were
+                # removed are known already, even if they left the cache.
+                if ts_create >= newest_create:
+                    new.append(news_id)
+                self.__newest_create = max(self.__newest_create, ts_create)
+            entries[news_id] = (stamp, item)
+            changed = True
+
+        while len(entries) > self.__size:
+            entries.popitem(last=False)
+        self.__latest = latest
+
+        if changed:
+            self.revision += 1
+        return new if notify else []
+
+    def get_unread_count(self) -> int:
+        """Return the number of unread news among the cached ones.
+
+        Returns:
+            int: The number of news marked as new.
+
+        """
+        return sum(1 for news_id in self.__latest if self.__entries[news_id][0][1])
+
+    def get_news(self) -> list[Mapping[str, Any]]:
+        """Return the cached news.
+
+        Returns:
+            list[Mapping[str, Any]]: The news items, newest first.
+
+        """
+        return [self.__entries[news_id][1] for news_id in self.__latest]
+
+    def get_item(self, news_id: int) -> Mapping[str, Any] | None:
+        """Return a cached news item.
+
+        Args:
+            news_id (int): The ID of the news.
+
+        Returns:
+            Mapping[str, Any] | None: The news item, None if it is not cached.
+
+        """
+        entry = self.__entries.get(news_id)
+        return None if entry is None else entry[1]
+
+    def __len__(self) -> int:
+        """Return the number of cached news."""
+        return len(self.__latest)
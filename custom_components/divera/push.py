@@ -0,0 +1,110 @@
+"""Push Module for Divera Integration."""
+
+from __future__ import annotations
+
+from aiohttp.web import Request, Response
+
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DATA_DIVERA_COORDINATOR,
+    DATA_DIVERA_FETCHER,
+    DATA_UCRS,
+    DATA_WEBHOOK_ID,
+    DOMAIN,
+    INTEGRATION_FULL_NAME,
+    LOGGER,
+)
+from .coordinator import DiveraCoordinator
+from .divera import DiveraFetcher
+
+
+@callback
+def async_register_webhook(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Register the push webhook of a config entry if it is enabled.
+
+    Divera can post alarms and status changes to the webhook. They are merged
+    into the cached data and published to the coordinators right away.
+
+    Args:
+        hass (HomeAssistant): Home Assistant instance.
+        entry (ConfigEntry): Configuration entry of the integration.
+
+    """
+    divera_hass_data = hass.data[DOMAIN][entry.entry_id]
+    webhook_id = entry.options.get(DATA_WEBHOOK_ID)
+    if webhook_id == divera_hass_data.get(DATA_WEBHOOK_ID):
+        return
+
+    async_unregister_webhook(hass, entry)
+    if webhook_id is None:
+        return
+
+    async def _async_handle_webhook(
+        hass: HomeAssistant, webhook_id: str, request: Request
+    ) -> Response | None:
+        try:
+            payload = await request.json()
+        except ValueError:
+            return Response(status=400)
+        if not isinstance(payload, dict):
+            return Response(status=400)
+        await async_handle_push(hass, entry, payload)
+        return None
+
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        f"{INTEGRATION_FULL_NAME} {entry.title}",
+        webhook_id,
+        _async_handle_webhook,
+        allowed_methods=["POST"],
+    )
+    divera_hass_data[DATA_WEBHOOK_ID] = webhook_id
+    # The webhook id is a secret, so its address is only shown in the options.
+    LOGGER.info("Receiving pushed data for %s", entry.title)
+
+
+@callback
+def async_unregister_webhook(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Unregister the push webhook of a config entry.
+
+    Args:
+        hass (HomeAssistant): Home Assistant instance.
+        entry (ConfigEntry): Configuration entry of the integration.
+
+    """
+    webhook_id = hass.data[DOMAIN][entry.entry_id].pop(DATA_WEBHOOK_ID, None)
+    if webhook_id is not None:
+        webhook.async_unregister(hass, webhook_id)
+
+
+async def async_handle_push(
+    hass: HomeAssistant, entry: ConfigEntry, payload: dict
+) -> None:
+    """Feed a pushed payload into the coordinators of a config entry.
+
+    Coordinators whose data could be updated from the payload are notified
+    immediately. If the payload cannot be assigned to a unit, all
+    coordinators of the entry request a refresh instead.
+
+    Args:
+        hass (HomeAssistant): Home Assistant instance.
+        entry (ConfigEntry): Configuration entry of the integration.
+        payload (dict): The pushed payload.
+
+    """
+    divera_hass_data = hass.data[DOMAIN][entry.entry_id]
+    fetcher: DiveraFetcher = divera_hass_data[DATA_DIVERA_FETCHER]
+    updated = fetcher.push(payload)
+
+    for ucr_id in entry.data[DATA_UCRS]:
+        coordinator: DiveraCoordinator = divera_hass_data[ucr_id][
+            DATA_DIVERA_COORDINATOR
+        ]
+        if str(ucr_id) in updated:
+            await coordinator.async_handle_push()
+        elif not updated:
+            await coordinator.async_request_refresh()
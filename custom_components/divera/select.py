@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import StateType
 
 from . import DiveraCoordinator
-from .const import DATA_DIVERA_COORDINATOR, DATA_UCRS, DOMAIN
+from .const import (
+    DATA_DIVERA_COORDINATOR,
+    DATA_UCRS,
+    DEFAULT_STATUS_WRITE_DELAY,
+    DOMAIN,
+    LOGGER,
+)
 from .divera import DiveraClient, DiveraError
 from .entity import DiveraEntity, DiveraEntityDescription
 
@@ -49,6 +58,7 @@ SENSORS: tuple[DiveraSelectEntityDescription, ...] = (
         options_fn=lambda divera: divera.get_all_state_name(),
         attribute_fn=lambda divera: divera.get_user_state_attributes(),
         select_option_fn=lambda divera, option: divera.set_user_state_by_name(option),
+        sections=("status", "cluster"),
     ),
 )
 
@@ -85,6 +95,14 @@ class DiveraSelectEntity(DiveraEntity, SelectEntity):
 
     Inherits from both DiveraEntity and SelectEntity.
 
+    Selected options are shown right away. Selections made within
+    DEFAULT_STATUS_WRITE_DELAY of each other are written with a single
+    request for the last one, after which the coordinator is refreshed. If
+    the write fails, the entity falls back to the option of the pulled data.
+    Selections made while a write is in progress are written after it.
+    Every selection waits for its write; it fails if the write does, or if
+    the entity is removed before it was written.
+
     Attributes:
         entity_description (DiveraSelectEntityDescription):
             Description of the selectable entity.
@@ -105,10 +123,22 @@ class DiveraSelectEntity(DiveraEntity, SelectEntity):
             description (DiveraSelectEntityDescription): Description of the selectable entity.
 
         """
+        self._optimistic_option: str | None = None
+        self._pending_option: str | None = None
+        self._waiters: list[asyncio.Future[None]] = []
+        self._unsub_write: CALLBACK_TYPE | None = None
+        self._write_task: asyncio.Task | None = None
         super().__init__(coordinator, description)
 
+    async def async_added_to_hass(self) -> None:
+        """Set up the cancelling of pending writes when the entity is removed."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_pending_option)
+
     def _divera_update(self) -> None:
         option = self.entity_description.current_option_fn(self.coordinator.data)
+        if self._optimistic_option is not None:
+            option = self._optimistic_option
         self._attr_current_option = option
 
         options = self.entity_description.options_fn(self.coordinator.data)
@@ -120,6 +150,9 @@ class DiveraSelectEntity(DiveraEntity, SelectEntity):
     async def async_select_option(self, option: str) -> None:
         """Select an option asynchronously.
 
+        The option is shown immediately and written together with the
+        selections that follow within the coalescing delay.
+
         Args:
             option (str): The option to select.
 
@@ -127,15 +160,104 @@ class DiveraSelectEntity(DiveraEntity, SelectEntity):
             HomeAssistantError: If an error occurs while selecting the option.
 
         """
+        self._optimistic_option = option
+        self._pending_option = option
+        self._attr_current_option = option
+        self.async_write_ha_state()
+
+        waiter = self.hass.loop.create_future()
+        self._waiters.append(waiter)
+        self._async_schedule_write()
+        await waiter
+
+    @callback
+    def _async_schedule_write(self) -> None:
+        # A write in progress schedules the next one when it is done.
+        if self._write_task is not None and not self._write_task.done():
+            return
+        if self._unsub_write is not None:
+            self._unsub_write()
+        self._unsub_write = async_call_later(
+            self.hass, DEFAULT_STATUS_WRITE_DELAY, self._async_start_write
+        )
+
+    @callback
+    def _async_start_write(self, _now: datetime) -> None:
+        self._unsub_write = None
+        self._write_task = self.hass.async_create_task(
+            self._async_write_option(), f"{self.entity_id} write option"
+        )
+
+    async def _async_write_option(self) -> None:
+        option = self._pending_option
+        waiters = self._waiters
+        self._pending_option = None
+        self._waiters = []
+        try:
+            if option is not None:
+                await self._async_write(option, waiters)
+        except Exception:
+            LOGGER.exception("Unexpected error while writing %s", self.entity_id)
+        finally:
+            self._write_task = None
+            if self._pending_option is not None:
+                self._async_schedule_write()
+
+    async def _async_write(
+        self, option: str, waiters: list[asyncio.Future[None]]
+    ) -> None:
+        error: BaseException | None = None
         try:
             await self.entity_description.select_option_fn(
                 self.coordinator.data, option
             )
         except DiveraError as exc:
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="user_state_error",
-                translation_placeholders={
-                    "cluster_name": self._cluster_name,
-                },
-            ) from exc
+            error = exc
+            return
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            if error is None:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+            else:
+                if self._pending_option is None:
+                    self._optimistic_option = None
+                    self._divera_update()
+                    self.async_write_ha_state()
+                self._fail_waiters(waiters, error)
+
+        await self.coordinator.async_refresh()
+        if self._pending_option is None and self._optimistic_option is not None:
+            self._optimistic_option = None
+            self._divera_update()
+            self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_pending_option(self) -> None:
+        """Fail the selections that were not written yet when the entity is removed."""
+        if self._unsub_write is not None:
+            self._unsub_write()
+            self._unsub_write = None
+        waiters = self._waiters
+        self._optimistic_option = None
+        self._pending_option = None
+        self._waiters = []
+        self._fail_waiters(waiters, None)
+
+    def _fail_waiters(
+        self, waiters: list[asyncio.Future[None]], cause: BaseException | None
+    ) -> None:
+        error = HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="user_state_error",
+            translation_placeholders={
+                "cluster_name": self._cluster_name,
+            },
+        )
+        error.__cause__ = cause
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_exception(error)
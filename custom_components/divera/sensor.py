@@ -2,19 +2,35 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DATA_DIVERA_COORDINATOR, DATA_UCRS, DOMAIN
+from .const import (
+    ALARM_HISTORY,
+    DATA_DIVERA_COORDINATOR,
+    DATA_DIVERA_VEHICLE_COORDINATOR,
+    DATA_UCRS,
+    DOMAIN,
+    MEMBER_STATUS,
+)
 from .coordinator import DiveraCoordinator
 from .divera import DiveraClient
 from .entity import DiveraEntity, DiveraEntityDescription
+from .vehicles import DiveraVehicleCoordinator
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -39,10 +55,99 @@ SENSORS: tuple[DiveraSensorEntityDescription, ...] = (
         icon="mdi:message-text",
         value_fn=lambda divera: divera.get_last_alarm(),
         attribute_fn=lambda divera: divera.get_last_alarm_attributes(),
+        sections=("alarm", "cluster"),
+    ),
+    DiveraSensorEntityDescription(
+        key="recent_alarms",
+        translation_key="recent_alarms",
+        icon="mdi:history",
+        value_fn=lambda divera: divera.get_recent_alarm_count(),
+        attribute_fn=lambda divera: {"alarms": divera.get_recent_alarms()},
+        sections=(ALARM_HISTORY,),
+    ),
+    DiveraSensorEntityDescription(
+        key="news",
+        translation_key="news",
+        icon="mdi:newspaper-variant-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda divera: divera.get_news_unread_count(),
+        attribute_fn=lambda divera: {"latest": divera.get_latest_news_attributes()},
+        sections=("news",),
     ),
 )
 
 
+def get_member_status_descriptions(
+    divera: DiveraClient,
+) -> list[DiveraSensorEntityDescription]:
+    """Build a description of a member count sensor for each state of the cluster.
+
+    Args:
+        divera (DiveraClient): The client of the cluster.
+
+    Returns:
+        list[DiveraSensorEntityDescription]: The descriptions, empty if the members of
+            the cluster are not visible to the user.
+
+    """
+    if not divera.get_member_count():
+        return []
+    descriptions: list[DiveraSensorEntityDescription] = []
+    for state_id in divera.get_all_state_ids():
+        state_name = divera.get_state_name_by_id(state_id)
+        descriptions.append(
+            DiveraSensorEntityDescription(
+                key=f"member_status_{state_id}",
+                translation_key="member_status",
+                translation_placeholders={"state": state_name},
+                icon="mdi:account-group",
+                state_class=SensorStateClass.MEASUREMENT,
+                value_fn=lambda divera, state_id=state_id: (
+                    divera.get_member_count_by_state(state_id)
+                ),
+                attribute_fn=lambda divera, state_id=state_id: {
+                    "groups": divera.get_group_member_counts_by_state(state_id)
+                },
+                sections=(MEMBER_STATUS,),
+            )
+        )
+    return descriptions
+
+
+def get_alarm_answer_descriptions(
+    divera: DiveraClient,
+) -> list[DiveraSensorEntityDescription]:
+    """Build a description of an alarm answer sensor for each state of the cluster.
+
+    Args:
+        divera (DiveraClient): The client of the cluster.
+
+    Returns:
+        list[DiveraSensorEntityDescription]: The descriptions.
+
+    """
+    descriptions: list[DiveraSensorEntityDescription] = []
+    for state_id in divera.get_all_state_ids():
+        state_name = divera.get_state_name_by_id(state_id)
+        descriptions.append(
+            DiveraSensorEntityDescription(
+                key=f"alarm_answer_{state_id}",
+                translation_key="alarm_answer",
+                translation_placeholders={"state": state_name},
+                icon="mdi:account-check",
+                state_class=SensorStateClass.MEASUREMENT,
+                value_fn=lambda divera, state_id=state_id: (
+                    divera.get_last_alarm_answer_count(state_id)
+                ),
+                attribute_fn=lambda divera, state_id=state_id: {
+                    "responders": divera.get_last_alarm_responders(state_id)
+                },
+                sections=("alarm", "cluster"),
+            )
+        )
+    return descriptions
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -58,15 +163,32 @@ async def async_setup_entry(
     """
     ucr_ids: list[int] = entry.data[DATA_UCRS]
 
-    entities: list[DiveraSensorEntity] = []
+    entities: list[SensorEntity] = []
 
     for ucr_id in ucr_ids:
         coordinator = hass.data[DOMAIN][entry.entry_id][ucr_id][DATA_DIVERA_COORDINATOR]
 
+        descriptions = [
+            *SENSORS,
+            *get_member_status_descriptions(coordinator.data),
+            *get_alarm_answer_descriptions(coordinator.data),
+        ]
         entities.extend(
-            [DiveraSensorEntity(coordinator, description) for description in SENSORS],
+            [
+                DiveraSensorEntity(coordinator, description)
+                for description in descriptions
+            ],
         )
 
+        vehicle_coordinator: DiveraVehicleCoordinator | None = hass.data[DOMAIN][
+            entry.entry_id
+        ][ucr_id].get(DATA_DIVERA_VEHICLE_COORDINATOR)
+        if vehicle_coordinator is not None and vehicle_coordinator.data:
+            entities.extend(
+                DiveraVehicleSensorEntity(vehicle_coordinator, ucr_id, vehicle_id)
+                for vehicle_id in vehicle_coordinator.data
+            )
+
     async_add_entities(entities, False)
 
 
@@ -102,3 +224,86 @@ class DiveraSensorEntity(DiveraEntity, SensorEntity):
         self._attr_native_value = value
         attributes = self.entity_description.attribute_fn(self.coordinator.data)
         self._attr_extra_state_attributes = attributes
+
+
+class DiveraVehicleSensorEntity(
+    CoordinatorEntity[DiveraVehicleCoordinator], SensorEntity
+):
+    """Represents the FMS status of a vehicle of a cluster.
+
+    The vehicles are updated by the vehicle coordinator of the cluster. The
+    state is only written if the vehicle changed or its availability did.
+
+    """
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "vehicle"
+    _attr_icon = "mdi:fire-truck"
+
+    def __init__(
+        self, coordinator: DiveraVehicleCoordinator, ucr_id, vehicle_id: int
+    ) -> None:
+        """Initialize DiveraVehicleSensorEntity.
+
+        Args:
+            coordinator (DiveraVehicleCoordinator): The vehicle coordinator of the cluster.
+            ucr_id (int): The UCR whose device the entity belongs to.
+            vehicle_id (int): The ID of the vehicle.
+
+        """
+        super().__init__(coordinator)
+        self._ucr_id = ucr_id
+        self._vehicle_id = vehicle_id
+        vehicle = coordinator.data[vehicle_id]
+        self._attr_unique_id = "_".join(
+            [DOMAIN, str(ucr_id), "vehicle", str(vehicle_id)]
+        )
+        self._attr_translation_placeholders = {
+            "name": vehicle.get("shortname") or vehicle.get("name") or str(vehicle_id)
+        }
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, str(ucr_id))})
+        self._last_available = self.available
+        self._vehicle_update()
+
+    @property
+    def available(self) -> bool:
+        """Return whether the vehicle is part of the data of the coordinator.
+
+        Returns:
+            bool: True if the vehicle is available.
+
+        """
+        return (
+            super().available
+            and self.coordinator.data is not None
+            and self._vehicle_id in self.coordinator.data
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        available = self.available
+        if (
+            available
+            and self._last_available
+            and self._vehicle_id not in self.coordinator.changed_ids
+        ):
+            return
+        self._last_available = available
+        if available:
+            self._vehicle_update()
+        self.async_write_ha_state()
+
+    def _vehicle_update(self) -> None:
+        vehicle: Mapping[str, Any] = self.coordinator.data[self._vehicle_id]
+        self._attr_native_value = vehicle.get("fmsstatus_id", vehicle.get("fmsstatus"))
+        status_ts = vehicle.get("fmsstatus_ts")
+        self._attr_extra_state_attributes = {
+            "id": vehicle.get("id"),
+            "name": vehicle.get("name"),
+            "fullname": vehicle.get("fullname"),
+            "shortname": vehicle.get("shortname"),
+            "note": vehicle.get("fmsstatus_note"),
+            "status_date": datetime.fromtimestamp(status_ts) if status_ts else None,
+            "latitude": vehicle.get("lat", vehicle.get("latitude")),
+            "longitude": vehicle.get("lng", vehicle.get("longitude")),
+        }
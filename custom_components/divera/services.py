@@ -0,0 +1,242 @@
+"""Services Module for Divera Integration."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    ATTR_CLUSTERS,
+    ATTR_STATUS,
+    DATA_DIVERA_COORDINATOR,
+    DATA_UCRS,
+    DEFAULT_STATUS_WRITE_CONCURRENCY,
+    DOMAIN,
+    LOGGER,
+    SERVICE_SET_STATUS,
+)
+from .coordinator import DiveraCoordinator
+from .divera import DiveraAuthError, DiveraError
+
+SET_STATUS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_STATUS): cv.string,
+        vol.Optional(ATTR_CLUSTERS): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration.
+
+    Args:
+        hass (HomeAssistant): Home Assistant instance.
+
+    """
+
+    async def _async_set_status(call: ServiceCall) -> ServiceResponse:
+        return await async_set_status(
+            hass,
+            call.data.get(ATTR_CONFIG_ENTRY_ID),
+            call.data[ATTR_STATUS],
+            call.data.get(ATTR_CLUSTERS),
+            call.return_response,
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_STATUS,
+        _async_set_status,
+        schema=SET_STATUS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+async def async_set_status(
+    hass: HomeAssistant,
+    entry_id: str | None,
+    status: str,
+    clusters: list[str] | None,
+    return_response: bool = False,
+) -> ServiceResponse:
+    """Set the status of the user in several units at once.
+
+    The status id of every unit is looked up in its pulled data and the
+    writes are sent concurrently, at most DEFAULT_STATUS_WRITE_CONCURRENCY at
+    a time. A failed write only fails its unit. The units that were changed
+    are refreshed afterwards.
+
+    Args:
+        hass (HomeAssistant): Home Assistant instance.
+        entry_id (str | None): ID of the config entry of the user, None if only one is loaded.
+        status (str): Name of the status to set.
+        clusters (list[str] | None): Names or UCR ids of the units, all units of the entry
+            if None.
+        return_response (bool, optional): Whether the results are returned instead of
+            raising on failed units. Defaults to False.
+
+    Returns:
+        ServiceResponse: The result of every unit if return_response is set, otherwise None.
+
+    Raises:
+        ServiceValidationError: If the config entry or a given unit cannot be resolved.
+        HomeAssistantError: If the status could not be set in a unit.
+
+    """
+    coordinators = get_coordinators(hass, entry_id, clusters)
+    semaphore = asyncio.Semaphore(DEFAULT_STATUS_WRITE_CONCURRENCY)
+
+    async def _async_write(coordinator: DiveraCoordinator) -> dict[str, Any]:
+        divera = coordinator.data
+        ucr_id = divera.get_active_ucr()
+        result: dict[str, Any] = {
+            "ucr_id": ucr_id,
+            "cluster_name": divera.get_cluster_name_from_ucr(ucr_id),
+            "success": False,
+            "error": None,
+        }
+        status_id = divera.get_state_id_by_name(status)
+        if status_id is None:
+            result["error"] = "unknown_status"
+            return result
+        async with semaphore:
+            try:
+                await divera.set_user_state_by_id(status_id)
+            except DiveraAuthError:
+                result["error"] = "authentication"
+                return result
+            except DiveraError:
+                result["error"] = "cannot_connect"
+                return result
+            except Exception:
+                LOGGER.exception(
+                    "Unexpected error while setting the status in %s",
+                    result["cluster_name"],
+                )
+                result["error"] = "unknown"
+                return result
+        result["success"] = True
+        hass.async_create_task(coordinator.async_request_refresh())
+        return result
+
+    results = await asyncio.gather(
+        *(_async_write(coordinator) for coordinator in coordinators)
+    )
+    if return_response:
+        return {"results": list(results)}
+
+    failed = [result["cluster_name"] for result in results if not result["success"]]
+    if failed:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="set_status_error",
+            translation_placeholders={
+                ATTR_STATUS: status,
+                ATTR_CLUSTERS: ", ".join(failed),
+            },
+        )
+    return None
+
+
+def get_coordinators(
+    hass: HomeAssistant, entry_id: str | None, clusters: list[str] | None
+) -> list[DiveraCoordinator]:
+    """Return the coordinators of the given units of a config entry.
+
+    Every config entry belongs to one user, so the units are only looked up
+    in a single entry. Without an entry id, there must be a single loaded
+    entry.
+
+    Args:
+        hass (HomeAssistant): Home Assistant instance.
+        entry_id (str | None): ID of the config entry, None if only one is loaded.
+        clusters (list[str] | None): Names or UCR ids of the units, all units of the entry
+            if None.
+
+    Returns:
+        list[DiveraCoordinator]: The coordinators with data.
+
+    Raises:
+        ServiceValidationError: If the config entry is not loaded or not given while
+            several are, or if a given unit is not loaded or its name is ambiguous.
+
+    """
+    divera_hass_data: dict[str, Any] = hass.data.get(DOMAIN, {})
+    if entry_id is None:
+        if len(divera_hass_data) != 1:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="config_entry_required",
+            )
+        entry_id = next(iter(divera_hass_data))
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN or entry_id not in divera_hass_data:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="config_entry_not_loaded",
+            translation_placeholders={ATTR_CONFIG_ENTRY_ID: entry_id},
+        )
+
+    coordinators: dict[str, DiveraCoordinator] = {}
+    keys_by_ucr: dict[str, set[str]] = {}
+    for ucr_id in entry.data.get(DATA_UCRS, ()):
+        if ucr_id not in divera_hass_data[entry_id]:
+            continue
+        coordinator: DiveraCoordinator = divera_hass_data[entry_id][ucr_id][
+            DATA_DIVERA_COORDINATOR
+        ]
+        if coordinator.data is None:
+            continue
+        coordinators[str(ucr_id)] = coordinator
+        keys_by_ucr[str(ucr_id)] = {
+            str(ucr_id),
+            coordinator.data.get_cluster_name_from_ucr(ucr_id),
+        }
+    if clusters is None:
+        if not coordinators:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="unknown_clusters",
+                translation_placeholders={ATTR_CLUSTERS: ""},
+            )
+        return list(coordinators.values())
+
+    selected: dict[str, DiveraCoordinator] = {}
+    missing: list[str] = []
+    ambiguous: list[str] = []
+    for cluster in clusters:
+        ucr_ids = [ucr_id for ucr_id, keys in keys_by_ucr.items() if cluster in keys]
+        if not ucr_ids:
+            missing.append(cluster)
+        elif len(ucr_ids) > 1:
+            ambiguous.append(cluster)
+        else:
+            selected[ucr_ids[0]] = coordinators[ucr_ids[0]]
+    if missing:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="unknown_clusters",
+            translation_placeholders={ATTR_CLUSTERS: ", ".join(missing)},
+        )
+    if ambiguous:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="ambiguous_clusters",
+            translation_placeholders={ATTR_CLUSTERS: ", ".join(ambiguous)},
+        )
+    return list(selected.values())
@@ -0,0 +1,123 @@
+"""Session Module for Divera Integration."""
+
+from __future__ import annotations
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util import ssl as ssl_util
+
+from .const import (
+    DATA_DIVERA_SESSIONS,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_CONNECTIONS_PER_HOST,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_REQUEST_TIMEOUT,
+)
+
+
+class DiveraSession:
+    """A client session to a Divera server shared by the config entries using it.
+
+    Connections are kept alive longer than the default polling interval, so
+    consecutive updates reuse the same TLS connection. DNS lookups are cached
+    and the number of connections to the server is limited.
+
+    Attributes:
+        session (ClientSession): The shared client session.
+        users (int): Number of config entries using the session.
+
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize DiveraSession.
+
+        Args:
+            hass (HomeAssistant): Home Assistant instance.
+
+        """
+        connector = TCPConnector(
+            limit_per_host=DEFAULT_CONNECTIONS_PER_HOST,
+            keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DEFAULT_DNS_CACHE_TTL,
+            ssl=ssl_util.get_default_context(),
+        )
+        self.session = ClientSession(
+            connector=connector,
+            headers={"User-Agent": SERVER_SOFTWARE},
+            json_serialize=json_dumps,
+            timeout=ClientTimeout(
+                total=DEFAULT_REQUEST_TIMEOUT,
+                connect=DEFAULT_CONNECT_TIMEOUT,
+                sock_read=DEFAULT_READ_TIMEOUT,
+            ),
+        )
+        self.users = 0
+
+        async def _async_close(event: Event) -> None:
+            # Like the sessions of Home Assistant, the session is detached and
+            # its connection pool closed at shutdown.
+            self.__unsub_close = None
+            self.session.detach()
+            await connector.close()
+
+        self.__unsub_close: CALLBACK_TYPE | None = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, _async_close
+        )
+
+    async def async_close(self) -> None:
+        """Close the session."""
+        if self.__unsub_close is not None:
+            self.__unsub_close()
+            self.__unsub_close = None
+        await self.session.close()
+
+
+@callback
+def async_get_session(hass: HomeAssistant, base_url: str) -> ClientSession:
+    """Return the session to a Divera server and register a user of it.
+
+    Every call must be paired with a call of async_release_session.
+
+    Args:
+        hass (HomeAssistant): Home Assistant instance.
+        base_url (str): Base URL of the Divera API.
+
+    Returns:
+        ClientSession: The session shared by all config entries of the server.
+
+    """
+    sessions: dict[str, DiveraSession] = hass.data.setdefault(DATA_DIVERA_SESSIONS, {})
+    divera_session = sessions.get(base_url)
+    if divera_session is None or divera_session.session.closed:
+        divera_session = sessions[base_url] = DiveraSession(hass)
+    divera_session.users += 1
+    return divera_session.session
+
+
+async def async_release_session(hass: HomeAssistant, base_url: str) -> None:
+    """Unregister a user of the session to a Divera server.
+
+    The session is closed when it has no users left.
+
+    Args:
+        hass (HomeAssistant): Home Assistant instance.
+        base_url (str): Base URL of the Divera API.
+
+    """
+    sessions: dict[str, DiveraSession] = hass.data.get(DATA_DIVERA_SESSIONS, {})
+    divera_session = sessions.get(base_url)
+    if divera_session is None:
+        return
+    divera_session.users -= 1
+    if divera_session.users > 0:
+        return
+    del sessions[base_url]
+    if not sessions:
+        hass.data.pop(DATA_DIVERA_SESSIONS, None)
+    await divera_session.async_close()
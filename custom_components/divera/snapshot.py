@@ -0,0 +1,199 @@
+"""Snapshot Module for Divera Integration."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from .utils import fingerprint
+
+EMPTY: Mapping[Any, Any] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
+class DiveraSnapshot:
+    """Immutable view of one pull/all payload with prebuilt lookup indexes.
+
+    The snapshot is built once per fetched payload and shared by every client
+    reading it, so the getters of DiveraClient are plain dictionary lookups
+    instead of walks over the nested payload.
+
+    Attributes:
+        payload (Mapping[str, Any]): The raw payload as returned by the API.
+        user (Mapping[str, Any]): The user section of the payload.
+        user_status (Mapping[str, Any]): The status section of the payload.
+        ucr_default (int | None): The default UCR of the user.
+        ucr_active (int | None): The UCR the payload was requested for.
+        cluster_version_id (int | None): The version id of the cluster.
+        status_names (Mapping[int, str]): Status names by status id.
+        status_ids (Mapping[str, int]): Status ids by status name.
+        status_name_list (tuple[str, ...]): Names of the selectable states in the sort order of the cluster.
+        status_id_list (tuple[int, ...]): Ids of the selectable states in the sort order of the cluster.
+        group_names (Mapping[int, str]): Group names by group id.
+        members (Mapping[str, Mapping[str, Any]]): Member items of the cluster by id.
+        ucr_names (Mapping[str, str]): Cluster names by UCR id.
+        ucr_ids_by_name (Mapping[str, tuple[str, ...]]): UCR ids by cluster name.
+        ucr_cluster_ids (Mapping[str, int]): Cluster ids by UCR id.
+        alarms (Mapping[int, Mapping[str, Any]]): Alarm items by alarm id.
+        alarm_sorting (tuple[int, ...]): Alarm ids, newest first.
+        events (Mapping[int, Mapping[str, Any]]): Event items of the cluster by event id.
+        status_plan (Mapping[int, Mapping[str, Any]]): Status plan items of the user by id.
+        news (Mapping[int, Mapping[str, Any]]): News items by news id.
+        news_sorting (tuple[int, ...]): News ids, newest first.
+        alarm_answers (dict[int, Mapping[str, int]]): Cache of the answer indexes
+            built by get_alarm_answers.
+        fingerprints (Mapping[str, int]): Content fingerprints by section name of the payload data.
+
+    """
+
+    payload: Mapping[str, Any]
+    user: Mapping[str, Any]
+    user_status: Mapping[str, Any]
+    ucr_default: int | None
+    ucr_active: int | None
+    cluster_version_id: int | None
+    status_names: Mapping[int, str]
+    status_ids: Mapping[str, int]
+    status_name_list: tuple[str, ...]
+    status_id_list: tuple[int, ...]
+    group_names: Mapping[int, str]
+    members: Mapping[str, Mapping[str, Any]]
+    ucr_names: Mapping[str, str]
+    ucr_ids_by_name: Mapping[str, tuple[str, ...]]
+    ucr_cluster_ids: Mapping[str, int]
+    alarms: Mapping[int, Mapping[str, Any]]
+    alarm_sorting: tuple[int, ...]
+    events: Mapping[int, Mapping[str, Any]]
+    status_plan: Mapping[int, Mapping[str, Any]]
+    news: Mapping[int, Mapping[str, Any]]
+    news_sorting: tuple[int, ...]
+    alarm_answers: dict[int, Mapping[str, int]]
+    fingerprints: Mapping[str, int]
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any]) -> DiveraSnapshot:
+        """Build a snapshot and its indexes from a pull/all payload.
+
+        Args:
+            payload (Mapping[str, Any]): The payload as returned by the API.
+
+        Returns:
+            DiveraSnapshot: The snapshot of the payload.
+
+        """
+        data = payload.get("data") or EMPTY
+        cluster = data.get("cluster") or EMPTY
+        alarm = data.get("alarm") or EMPTY
+        news = data.get("news") or EMPTY
+
+        status = cluster.get("status") or EMPTY
+        status_names: dict[int, str] = {}
+        for state_id in cluster.get("statussorting") or ():
+            state = status.get(str(state_id))
+            if state is not None:
+                status_names[int(state_id)] = state["name"]
+        status_name_list = tuple(status_names.values())
+        status_id_list = tuple(status_names)
+        for state_id, state in status.items():
+            status_names.setdefault(int(state_id), state["name"])
+        status_ids: dict[str, int] = {}
+        for state_id, state_name in status_names.items():
+            status_ids.setdefault(state_name, state_id)
+
+        group_names = {
+            int(group_id): group["name"]
+            for group_id, group in (cluster.get("group") or EMPTY).items()
+        }
+
+        ucr_names: dict[str, str] = {}
+        ucr_cluster_ids: dict[str, int] = {}
+        ucr_ids_by_name: dict[str, list[str]] = {}
+        for ucr_id, ucr in (data.get("ucr") or EMPTY).items():
+            ucr_names[ucr_id] = ucr["name"]
+            ucr_cluster_ids[ucr_id] = ucr.get("cluster_id")
+            ucr_ids_by_name.setdefault(ucr["name"], []).append(ucr_id)
+
+        alarms = {
+            int(alarm_id): item
+            for alarm_id, item in (alarm.get("items") or EMPTY).items()
+        }
+
+        return cls(
+            payload=payload,
+            user=data.get("user") or EMPTY,
+            user_status=data.get("status") or EMPTY,
+            ucr_default=data.get("ucr_default"),
+            ucr_active=data.get("ucr_active"),
+            cluster_version_id=cluster.get("version_id"),
+            status_names=MappingProxyType(status_names),
+            status_ids=MappingProxyType(status_ids),
+            status_name_list=status_name_list,
+            status_id_list=status_id_list,
+            group_names=MappingProxyType(group_names),
+            members=cluster.get("consumer") or EMPTY,
+            ucr_names=MappingProxyType(ucr_names),
+            ucr_ids_by_name=MappingProxyType(
+                {name: tuple(ids) for name, ids in ucr_ids_by_name.items()}
+            ),
+            ucr_cluster_ids=MappingProxyType(ucr_cluster_ids),
+            alarms=MappingProxyType(alarms),
+            fingerprints=MappingProxyType(
+                {key: fingerprint(section) for key, section in data.items()}
+            ),
+            alarm_sorting=tuple(
+                int(alarm_id) for alarm_id in alarm.get("sorting") or ()
+            ),
+            events=_get_items(data.get("events")),
+            status_plan=_get_items(data.get("statusplan")),
+            news=_get_items(news),
+            news_sorting=tuple(int(news_id) for news_id in news.get("sorting") or ()),
+            alarm_answers={},
+        )
+
+    def get_alarm_answers(self, alarm_id: int) -> Mapping[str, int]:
+        """Return the answered status ids of an alarm by responding UCR id.
+
+        The index is built on the first call for an alarm and kept for the
+        lifetime of the snapshot, so looking up the answer of a member does
+        not walk the answer lists of every state again.
+
+        Args:
+            alarm_id (int): The ID of the alarm.
+
+        Returns:
+            Mapping[str, int]: The status ids by UCR id, empty if the alarm is unknown.
+
+        """
+        answers = self.alarm_answers.get(alarm_id)
+        if answers is None:
+            item = self.alarms.get(alarm_id) or EMPTY
+            answers = self.alarm_answers[alarm_id] = MappingProxyType(
+                {
+                    str(ucr_id): int(state_id)
+                    for state_id, answered in (
+                        item.get("ucr_answered") or EMPTY
+                    ).items()
+                    for ucr_id in answered
+                }
+            )
+        return answers
+
+
+def _get_items(section: Any) -> Mapping[int, Mapping[str, Any]]:
+    """Return the items of a section of a pull/all payload by their integer id.
+
+    Args:
+        section (Any): The section, None if it is missing.
+
+    Returns:
+        Mapping[int, Mapping[str, Any]]: The items by id, empty if the section has none.
+
+    """
+    if not isinstance(section, Mapping):
+        return EMPTY
+    items = section.get("items")
+    if not isinstance(items, Mapping):
+        return EMPTY
+    return MappingProxyType({int(item_id): item for item_id, item in items.items()})
@@ -0,0 +1,141 @@
+"""Store Module for Divera Integration."""
+
+from __future__ import annotations
+
+from time import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DATA_DIVERA_STORES,
+    DEFAULT_SNAPSHOT_MAX_AGE,
+    DEFAULT_SNAPSHOT_SAVE_DELAY,
+    DOMAIN,
+    LOGGER,
+    STORAGE_VERSION,
+)
+from .divera import DiveraFetcher
+
+
+class DiveraStore:
+    """Persists the latest payloads of a config entry between restarts.
+
+    The payloads of all UCRs of the entry are saved together with the time
+    they were saved. Saves are delayed and coalesced, so a burst of changes
+    results in a single write. Payloads older than DEFAULT_SNAPSHOT_MAX_AGE
+    are not restored.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, fetcher: DiveraFetcher
+    ) -> None:
+        """Initialize DiveraStore.
+
+        Args:
+            hass (HomeAssistant): Home Assistant instance.
+            entry_id (str): ID of the config entry.
+            fetcher (DiveraFetcher): Fetcher holding the payloads of the entry.
+
+        """
+        self.__store = get_store(hass, entry_id)
+        self.__fetcher = fetcher
+        self.__restored_age: float | None = None
+        self.__save_scheduled = False
+
+    async def async_load(self) -> dict[str, dict]:
+        """Load the persisted payloads.
+
+        Returns:
+            dict[str, dict]: The payloads by UCR id, empty if none were saved or they are too old.
+
+        """
+        data = await self.__store.async_load()
+        if not data:
+            return {}
+        age = time() - (data.get("saved_at") or 0)
+        if age > DEFAULT_SNAPSHOT_MAX_AGE:
+            LOGGER.debug("Ignoring persisted payloads saved %d seconds ago", age)
+            return {}
+        self.__restored_age = round(age)
+        return data.get("payloads") or {}
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the latest payloads after a delay."""
+        self.__save_scheduled = True
+        self.__store.async_delay_save(self.__data_to_save, DEFAULT_SNAPSHOT_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Save a scheduled save right away, e.g. when the entry is unloaded.
+
+        The delayed save is cancelled, so it cannot write after the entry is gone.
+        """
+        if self.__save_scheduled:
+            await self.__store.async_save(self.__data_to_save())
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return the state of the store.
+
+        Returns:
+            dict[str, Any]: The age in seconds of the payloads restored on setup, None if
+                nothing was restored.
+
+        """
+        return {"restored_age": self.__restored_age}
+
+    def __data_to_save(self) -> dict[str, Any]:
+        self.__save_scheduled = False
+        return {"saved_at": time(), "payloads": self.__fetcher.get_payloads()}
+
+
+def get_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the storage of the persisted payloads of a config entry.
+
+    There is one instance per entry, so a removal cancels the delayed saves
+    of the entry instead of racing them.
+
+    Args:
+        hass (HomeAssistant): Home Assistant instance.
+        entry_id (str): ID of the config entry.
+
+    Returns:
+        Store[dict[str, Any]]: The storage of the entry.
+
+    """
+    stores: dict[str, Store[dict[str, Any]]] = hass.data.setdefault(
+        DATA_DIVERA_STORES, {}
+    )
+    store = stores.get(entry_id)
+    if store is None:
+        store = stores[entry_id] = Store(hass, STORAGE_VERSION, get_store_key(entry_id))
+    return store
+
+
+def get_store_key(entry_id: str) -> str:
+    """Return the storage key of a config entry.
+
+    Args:
+        entry_id (str): ID of the config entry.
+
+    Returns:
+        str: The storage key.
+
+    """
+    return f"{DOMAIN}.{entry_id}"
+
+
+async def async_remove_store(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the persisted payloads of a config entry.
+
+    Args:
+        hass (HomeAssistant): Home Assistant instance.
+        entry_id (str): ID of the config entry.
+
+    """
+    store = get_store(hass, entry_id)
+    hass.data[DATA_DIVERA_STORES].pop(entry_id, None)
+    if not hass.data[DATA_DIVERA_STORES]:
+        hass.data.pop(DATA_DIVERA_STORES)
+    await store.async_remove()
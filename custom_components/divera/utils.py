@@ -1,7 +1,15 @@
 """Utils Module for Divera Integration."""
 
+import json
+from math import atan2, cos, degrees, radians, sin
+
 from yarl import URL
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 def remove_params_from_url(url: URL):
     """Remove parameters from a URL.
@@ -16,3 +24,135 @@ def remove_params_from_url(url: URL):
     url.with_query()
     url_str: str = url.human_repr()
     return url_str
+
+
+def merge_section(old, new, merge_items: bool = False):
+    """Merge a partial section of a pull/all payload into the cached one.
+
+    Sections with ``items`` are merged by item id and newer items win. Ids
+    that are new to the sorting are placed in front of the cached sorting,
+    known ids keep their position. Other sections are replaced when the
+    partial section carries data.
+
+    Args:
+        old (dict | None): The cached section.
+        new (dict | None): The partial section of the latest response.
+        merge_items (bool, optional): Whether the fields of newer items are merged into
+            the cached items instead of replacing them, for items that only carry some
+            of their fields, like pushed alarms. Defaults to False.
+
+    Returns:
+        dict | None: The merged section.
+
+    """
+    if not new:
+        return old
+    if not old or not isinstance(new, dict) or "items" not in new:
+        return new
+
+    items = {**(old.get("items") or {})}
+    for item_id, item in (new.get("items") or {}).items():
+        cached = items.get(item_id)
+        if merge_items and isinstance(cached, dict) and isinstance(item, dict):
+            item = {**cached, **item}
+        items[item_id] = item
+    old_sorting = old.get("sorting") or []
+    known = set(old_sorting)
+    sorting = [
+        item_id for item_id in new.get("sorting") or [] if item_id not in known
+    ] + old_sorting
+    return {**old, **new, "items": items, "sorting": sorting}
+
+
+def section_timestamp(section) -> int:
+    """Return the newest server timestamp found in a section.
+
+    Args:
+        section (dict | None): A section of a pull/all payload.
+
+    Returns:
+        int: The newest ``ts_update`` or ``ts_create`` of the section items, 0 if there is none.
+
+    """
+    if not isinstance(section, dict):
+        return 0
+    items = section.get("items")
+    if not isinstance(items, dict):
+        return 0
+    return max(
+        (
+            item.get("ts_update") or item.get("ts_create") or 0
+            for item in items.values()
+            if isinstance(item, dict)
+        ),
+        default=0,
+    )
+
+
+def section_has_gaps(section) -> bool:
+    """Check whether the sorting of a section references unknown items.
+
+    Args:
+        section (dict | None): A section of a pull/all payload.
+
+    Returns:
+        bool: True if an id of the sorting has no item.
+
+    """
+    if not isinstance(section, dict) or "items" not in section:
+        return False
+    items = section.get("items") or {}
+    return any(str(item_id) not in items for item_id in section.get("sorting") or [])
+
+
+def fingerprint(section) -> int:
+    """Return a fingerprint of a section of a pull/all payload.
+
+    Args:
+        section (Any): A JSON serializable section of a pull/all payload.
+
+    Returns:
+        int: A hash that changes whenever the content of the section changes.
+
+    """
+    if orjson is not None:
+        return hash(orjson.dumps(section, option=orjson.OPT_SORT_KEYS))
+    return hash(json.dumps(section, sort_keys=True, separators=(",", ":")))
+
+
+def json_loads(body: bytes | str):
+    """Decode a JSON document, using orjson if it is available.
+
+    Args:
+        body (bytes | str): The JSON document.
+
+    Returns:
+        Any: The decoded document.
+
+    Raises:
+        ValueError: If the document is not valid JSON.
+
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def get_bearing(latitude1, longitude1, latitude2, longitude2) -> float:
+    """Return the initial bearing from one point to another.
+
+    Args:
+        latitude1 (float): Latitude of the start point in degrees.
+        longitude1 (float): Longitude of the start point in degrees.
+        latitude2 (float): Latitude of the destination in degrees.
+        longitude2 (float): Longitude of the destination in degrees.
+
+    Returns:
+        float: The bearing in degrees clockwise from north, between 0 and 360.
+
+    """
+    phi1, phi2 = radians(latitude1), radians(latitude2)
+    delta = radians(longitude2 - longitude1)
+    x = sin(delta) * cos(phi2)
+    y = cos(phi1) * sin(phi2) - sin(phi1) * cos(phi2) * cos(delta)
+    return (degrees(atan2(x, y)) + 360) % 360
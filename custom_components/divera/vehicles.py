@@ -0,0 +1,160 @@
+"""Vehicle Module for Divera Integration."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DATA_DIVERA_VEHICLES, DEFAULT_VEHICLE_SCAN_INTERVAL, LOGGER
+from .divera import DiveraError, DiveraFetcher
+
+
+class DiveraVehicleCoordinator(DataUpdateCoordinator[Mapping[int, Mapping[str, Any]]]):
+    """Coordinator of the vehicles of one cluster, shared by all its users.
+
+    Every user of a cluster sees the same vehicles, so they are fetched once
+    per cluster instead of once per UCR coordinator. The request is made with
+    the fetcher and UCR of one of the registered users; if that user goes
+    away, another one takes over.
+
+    The data are the vehicle items by vehicle id. After every update,
+    changed_ids holds the ids of the vehicles that were added or changed, so
+    entities of unchanged vehicles can skip writing their state.
+
+    Attributes:
+        changed_ids (frozenset[int]): Ids of the vehicles changed by the last update.
+
+    """
+
+    def __init__(self, hass: HomeAssistant, cluster_id: int) -> None:
+        """Initialize DiveraVehicleCoordinator.
+
+        Args:
+            hass (HomeAssistant): Home Assistant instance.
+            cluster_id (int): ID of the cluster.
+
+        """
+        super().__init__(
+            hass,
+            LOGGER,
+            name=f"Divera Vehicle Coordinator {cluster_id}",
+            update_interval=timedelta(seconds=DEFAULT_VEHICLE_SCAN_INTERVAL),
+        )
+        self.changed_ids: frozenset[int] = frozenset()
+        self._users: dict[str, tuple[DiveraFetcher, Any]] = {}
+
+    async def _async_update_data(self) -> Mapping[int, Mapping[str, Any]]:
+        fetcher, ucr_id = next(iter(self._users.values()))
+        try:
+            items = await fetcher.fetch_vehicles(ucr_id)
+        except DiveraError as err:
+            raise UpdateFailed(f"Error communicating with API: {err}") from None
+
+        previous = self.data or {}
+        vehicles = {
+            int(item["id"]): item
+            for item in items
+            if isinstance(item, dict) and item.get("id") is not None
+        }
+        self.changed_ids = frozenset(
+            vehicle_id
+            for vehicle_id, item in vehicles.items()
+            if previous.get(vehicle_id) != item
+        )
+        return MappingProxyType(vehicles)
+
+    def add_user(self, entry_id: str, fetcher: DiveraFetcher, ucr_id) -> None:
+        """Register a config entry using the vehicles of the cluster.
+
+        Args:
+            entry_id (str): ID of the config entry.
+            fetcher (DiveraFetcher): Fetcher of the config entry.
+            ucr_id (int): UCR of the config entry in the cluster.
+
+        """
+        self._users[entry_id] = (fetcher, ucr_id)
+
+    def remove_user(self, entry_id: str) -> bool:
+        """Unregister a config entry.
+
+        Args:
+            entry_id (str): ID of the config entry.
+
+        Returns:
+            bool: True if the coordinator has no users left.
+
+        """
+        self._users.pop(entry_id, None)
+        return not self._users
+
+
+async def async_get_vehicle_coordinator(
+    hass: HomeAssistant,
+    entry_id: str,
+    fetcher: DiveraFetcher,
+    base_url: str,
+    cluster_id: int,
+    ucr_id,
+) -> DiveraVehicleCoordinator:
+    """Return the vehicle coordinator of a cluster and register a user of it.
+
+    The coordinator is created and refreshed for the first user. Every call
+    must be paired with a call of async_release_vehicle_coordinator.
+
+    Args:
+        hass (HomeAssistant): Home Assistant instance.
+        entry_id (str): ID of the config entry.
+        fetcher (DiveraFetcher): Fetcher of the config entry.
+        base_url (str): Base URL of the Divera API.
+        cluster_id (int): ID of the cluster.
+        ucr_id (int): UCR of the config entry in the cluster.
+
+    Returns:
+        DiveraVehicleCoordinator: The coordinator shared by all users of the cluster.
+
+    """
+    coordinators: dict[tuple[str, int], DiveraVehicleCoordinator] = (
+        hass.data.setdefault(DATA_DIVERA_VEHICLES, {})
+    )
+    coordinator = coordinators.get((base_url, cluster_id))
+    if coordinator is not None:
+        coordinator.add_user(entry_id, fetcher, ucr_id)
+        return coordinator
+
+    coordinator = coordinators[(base_url, cluster_id)] = DiveraVehicleCoordinator(
+        hass, cluster_id
+    )
+    coordinator.add_user(entry_id, fetcher, ucr_id)
+    await coordinator.async_refresh()
+    return coordinator
+
+
+async def async_release_vehicle_coordinator(
+    hass: HomeAssistant, entry_id: str, base_url: str, cluster_id: int
+) -> None:
+    """Unregister a user of the vehicle coordinator of a cluster.
+
+    The coordinator is shut down when it has no users left.
+
+    Args:
+        hass (HomeAssistant): Home Assistant instance.
+        entry_id (str): ID of the config entry.
+        base_url (str): Base URL of the Divera API.
+        cluster_id (int): ID of the cluster.
+
+    """
+    coordinators: dict[tuple[str, int], DiveraVehicleCoordinator] = hass.data.get(
+        DATA_DIVERA_VEHICLES, {}
+    )
+    coordinator = coordinators.get((base_url, cluster_id))
+    if coordinator is None or not coordinator.remove_user(entry_id):
+        return
+    del coordinators[(base_url, cluster_id)]
+    if not coordinators:
+        hass.data.pop(DATA_DIVERA_VEHICLES, None)
+    await coordinator.async_shutdown()
@@ -0,0 +1,650 @@
+"""Offline benchmarks for the Divera integration.
+
+Synthetic pull/all payloads of large clusters, with thousands of members,
+groups, states and alarms, are served by a local aiohttp stand-in for the
+Divera API. The benchmarks time decoding and indexing of the payload,
+``DiveraClient.pull_data`` against the stand-in, every getter used by the
+entities and whole coordinator refreshes up to the state write of the
+entities.
+
+Run from the root of the repository in the development environment:
+
+    python scripts/benchmark.py --members 5000 --output baseline.json
+    python scripts/benchmark.py --members 5000 --compare baseline.json
+
+Results are printed as a table and can be written as JSON. When compared to
+a previous result, the script exits with status 1 if the median of any
+benchmark got slower by more than the tolerance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+import json
+from pathlib import Path
+import platform
+import random
+import statistics
+import sys
+import tempfile
+from time import perf_counter
+from typing import Any, Self
+
+from aiohttp import ClientSession, hdrs, web
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.divera.const import (  # noqa: E402
+    DIVERA_API_PULL_PATH,
+    DIVERA_API_STATUS_PATH,
+    REQUIRED_SECTIONS,
+)
+from custom_components.divera.divera import DiveraClient, DiveraFetcher  # noqa: E402
+from custom_components.divera.snapshot import DiveraSnapshot  # noqa: E402
+from custom_components.divera.utils import json_loads, orjson  # noqa: E402
+
+ACCESSKEY = "benchmark"
+NOW = 1_700_000_000
+
+GETTERS: dict[str, Callable[[DiveraClient], Any]] = {
+    "get_user": lambda divera: divera.get_user(),
+    "get_user_state": lambda divera: divera.get_user_state(),
+    "get_user_state_attributes": lambda divera: divera.get_user_state_attributes(),
+    "get_all_state_name": lambda divera: divera.get_all_state_name(),
+    "get_state_id_by_name": lambda divera: divera.get_state_id_by_name("Status 1"),
+    "get_last_alarm": lambda divera: divera.get_last_alarm(),
+    "get_last_alarm_attributes": lambda divera: divera.get_last_alarm_attributes(),
+    "is_last_alarm_open": lambda divera: divera.is_last_alarm_open(),
+    "get_recent_alarms": lambda divera: divera.get_recent_alarms(),
+    "get_last_alarm_answer_count": lambda divera: (
+        divera.get_last_alarm_answer_count(1)
+    ),
+    "get_last_alarm_responders": lambda divera: divera.get_last_alarm_responders(1),
+    "get_member_count_by_state": lambda divera: divera.get_member_count_by_state(1),
+    "get_group_member_counts_by_state": lambda divera: (
+        divera.get_group_member_counts_by_state(1)
+    ),
+    "get_all_cluster_names": lambda divera: divera.get_all_cluster_names(),
+    "get_ucr_ids": lambda divera: divera.get_ucr_ids(["Cluster 1"]),
+    "get_cluster_version": lambda divera: divera.get_cluster_version(),
+    "get_fingerprint": lambda divera: divera.get_fingerprint(("alarm", "cluster")),
+    "get_events": lambda divera: divera.get_events(NOW, NOW + 31 * 86400),
+    "get_next_event": lambda divera: divera.get_next_event(NOW),
+    "get_status_plan": lambda divera: divera.get_status_plan(NOW, NOW + 31 * 86400),
+    "get_news_unread_count": lambda divera: divera.get_news_unread_count(),
+    "get_latest_news_attributes": lambda divera: divera.get_latest_news_attributes(),
+    "is_alarm_active": lambda divera: divera.is_alarm_active(),
+    "get_active_alarm_attributes": lambda divera: (
+        divera.get_active_alarm_attributes()
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Result:
+    """Timings of one benchmark in milliseconds.
+
+    Attributes:
+        rounds (int): Number of measured rounds.
+        median (float): Median duration of a round.
+        mean (float): Mean duration of a round.
+        minimum (float): Fastest round.
+        p95 (float): 95th percentile of the rounds.
+
+    """
+
+    rounds: int
+    median: float
+    mean: float
+    minimum: float
+    p95: float
+
+    @classmethod
+    def from_durations(cls, durations: list[float]) -> Result:
+        """Summarize the measured durations of a benchmark.
+
+        Args:
+            durations (list[float]): Durations of the rounds in seconds.
+
+        Returns:
+            Result: The summary in milliseconds.
+
+        """
+        durations = sorted(durations)
+        return cls(
+            rounds=len(durations),
+            median=statistics.median(durations) * 1000,
+            mean=statistics.fmean(durations) * 1000,
+            minimum=durations[0] * 1000,
+            p95=durations[min(len(durations) - 1, int(len(durations) * 0.95))] * 1000,
+        )
+
+
+def build_payload(
+    members: int,
+    groups: int,
+    states: int,
+    alarms: int,
+    ucrs: int,
+    seed: int,
+    events: int = 0,
+) -> dict[str, Any]:
+    """Build a synthetic pull/all payload.
+
+    Args:
+        members (int): Number of members of the cluster.
+        groups (int): Number of groups of the cluster.
+        states (int): Number of states of the cluster.
+        alarms (int): Number of alarms.
+        ucrs (int): Number of UCRs of the user.
+        seed (int): Seed of the random generator.
+        events (int, optional): Number of events, spread over three years around now,
+            and of news. The status plan gets a tenth of them. Defaults to 0.
+
+    Returns:
+        dict[str, Any]: The payload shaped like a pull/all response.
+
+    """
+    rnd = random.Random(seed)
+    state_ids = list(range(1, states + 1))
+    group_ids = list(range(1, groups + 1))
+    member_ids = list(range(1000, 1000 + members))
+
+    consumer = {
+        str(member_id): {
+            "id": member_id,
+            "firstname": f"First {member_id}",
+            "lastname": f"Last {member_id}",
+            "stdformat_name": f"Last {member_id}, First {member_id}",
+            "group": rnd.sample(group_ids, min(3, groups)),
+            "status_id": rnd.choice(state_ids),
+        }
+        for member_id in member_ids
+    }
+
+    items: dict[str, Any] = {}
+    for alarm_id in range(1, alarms + 1):
+        answered: dict[str, dict[str, Any]] = {}
+        for member_id in rnd.sample(member_ids, min(50, members)):
+            answered.setdefault(str(rnd.choice(state_ids)), {})[str(member_id)] = {
+                "ts": NOW,
+                "note": "",
+            }
+        items[str(alarm_id)] = {
+            "id": alarm_id,
+            "foreign_id": f"F{alarm_id}",
+            "title": f"Alarm {alarm_id}",
+            "text": "Synthetic alarm " * 10,
+            "date": NOW - alarm_id * 60,
+            "address": f"Street {alarm_id}, Town",
+            "lat": 50 + rnd.random(),
+            "lng": 8 + rnd.random(),
+            "group": rnd.sample(group_ids, min(5, groups)),
+            "priority": True,
+            "closed": alarm_id != alarms,
+            "new": alarm_id == alarms,
+            "ucr_self_addressed": True,
+            "ucr_answered": answered,
+            "ts_create": NOW - alarm_id * 60,
+            "ts_update": NOW - alarm_id * 30,
+        }
+
+    event_items: dict[str, Any] = {}
+    for event_id in range(1, events + 1):
+        start = NOW + rnd.randint(-365, 2 * 365) * 86400 + rnd.randint(0, 86399)
+        event_items[str(event_id)] = {
+            "id": event_id,
+            "title": f"Event {event_id}",
+            "text": "Synthetic event",
+            "address": f"Street {event_id}, Town",
+            "start": start,
+            "end": start + rnd.randint(1, 4) * 3600,
+            "fullday": rnd.random() < 0.05,
+            "ts_create": NOW - 86400,
+            "ts_update": NOW - 3600,
+        }
+    plan_items: dict[str, Any] = {}
+    for plan_id in range(1, events // 10 + 1):
+        start = NOW + rnd.randint(-30, 365) * 86400
+        plan_items[str(plan_id)] = {
+            "id": plan_id,
+            "status_id": rnd.choice(state_ids),
+            "start": start,
+            "end": start + rnd.randint(1, 14) * 86400,
+            "ts_update": NOW - 3600,
+        }
+
+    news_items: dict[str, Any] = {
+        str(news_id): {
+            "id": news_id,
+            "title": f"News {news_id}",
+            "text": "Synthetic news " * 10,
+            "new": news_id > events - 5,
+            "ts_create": NOW - (events - news_id) * 3600,
+            "ts_update": NOW - (events - news_id) * 3600,
+        }
+        for news_id in range(1, events + 1)
+    }
+
+    ucr = {
+        str(ucr_id): {"id": ucr_id, "name": f"Cluster {ucr_id}", "cluster_id": ucr_id}
+        for ucr_id in range(1, ucrs + 1)
+    }
+
+    return {
+        "success": True,
+        "data": {
+            "user": {
+                "firstname": "Bench",
+                "lastname": "Mark",
+                "email": "bench@example.com",
+                "accesskey": ACCESSKEY,
+            },
+            "status": {"status_id": state_ids[0], "status_set_date": NOW},
+            "ucr": ucr,
+            "ucr_default": 1,
+            "ucr_active": 1,
+            "cluster": {
+                "name": "Cluster 1",
+                "version_id": 3,
+                "status": {
+                    str(state_id): {"id": state_id, "name": f"Status {state_id}"}
+                    for state_id in state_ids
+                },
+                "statussorting": state_ids,
+                "group": {
+                    str(group_id): {"id": group_id, "name": f"Group {group_id}"}
+                    for group_id in group_ids
+                },
+                "consumer": consumer,
+            },
+            "alarm": {
+                "items": items,
+                "sorting": sorted((int(alarm_id) for alarm_id in items), reverse=True),
+            },
+            "news": {
+                "items": news_items,
+                "sorting": sorted(
+                    (int(news_id) for news_id in news_items), reverse=True
+                ),
+            },
+            "events": {"items": event_items, "sorting": sorted(event_items)},
+            "statusplan": {"items": plan_items, "sorting": sorted(plan_items)},
+        },
+    }
+
+
+def encode(payload: dict[str, Any]) -> bytes:
+    """Encode a payload the way the API sends it.
+
+    Args:
+        payload (dict[str, Any]): The payload.
+
+    Returns:
+        bytes: The JSON body.
+
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+class StandInServer:
+    """Local HTTP server answering pull/all and status requests like Divera.
+
+    The payload is served with an ETag, so conditional requests are answered
+    with 304 Not Modified until the payload changes.
+    """
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        """Initialize StandInServer.
+
+        Args:
+            payload (dict[str, Any]): The payload to serve.
+
+        """
+        self.payload = payload
+        self.requests = 0
+        self.__version = 0
+        self.__body = encode(payload)
+        self.__runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    def touch(self) -> None:
+        """Change the status of the user and one member so that the next pull differs."""
+        self.__version += 1
+        status = self.payload["data"]["status"]
+        cluster = self.payload["data"]["cluster"]
+        states = cluster["statussorting"]
+        status["status_id"] = states[self.__version % len(states)]
+        status["status_set_date"] = NOW + self.__version
+        if cluster["consumer"]:
+            member = next(iter(cluster["consumer"].values()))
+            member["status_id"] = status["status_id"]
+        self.__body = encode(self.payload)
+
+    async def __aenter__(self) -> Self:
+        """Start the server on a free local port."""
+        app = web.Application()
+        app.router.add_get(DIVERA_API_PULL_PATH, self.__pull)
+        app.router.add_post(DIVERA_API_STATUS_PATH, self.__status)
+        self.__runner = web.AppRunner(app, access_log=None)
+        await self.__runner.setup()
+        site = web.TCPSite(self.__runner, "127.0.0.1", 0)
+        await site.start()
+        port = self.__runner.addresses[0][1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Stop the server."""
+        if self.__runner is not None:
+            await self.__runner.cleanup()
+
+    async def __pull(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        etag = f'"{self.__version}"'
+        if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+            return web.Response(status=304, headers={hdrs.ETAG: etag})
+        return web.Response(
+            body=self.__body,
+            content_type="application/json",
+            headers={hdrs.ETAG: etag},
+        )
+
+    async def __status(self, request: web.Request) -> web.Response:
+        return web.json_response({"success": True})
+
+
+async def measure(
+    func: Callable[[], Awaitable[Any]], rounds: int, warmup: int
+) -> Result:
+    """Time an awaitable function.
+
+    Args:
+        func (Callable[[], Awaitable[Any]]): The function to time.
+        rounds (int): Number of measured rounds.
+        warmup (int): Number of rounds run before measuring.
+
+    Returns:
+        Result: The timings of the measured rounds.
+
+    """
+    for _ in range(warmup):
+        await func()
+    durations = []
+    for _ in range(rounds):
+        start = perf_counter()
+        await func()
+        durations.append(perf_counter() - start)
+    return Result.from_durations(durations)
+
+
+def measure_sync(func: Callable[[], Any], rounds: int, warmup: int) -> Result:
+    """Time a plain function.
+
+    Args:
+        func (Callable[[], Any]): The function to time.
+        rounds (int): Number of measured rounds.
+        warmup (int): Number of rounds run before measuring.
+
+    Returns:
+        Result: The timings of the measured rounds.
+
+    """
+    for _ in range(warmup):
+        func()
+    durations = []
+    for _ in range(rounds):
+        start = perf_counter()
+        func()
+        durations.append(perf_counter() - start)
+    return Result.from_durations(durations)
+
+
+async def run_client_benchmarks(
+    server: StandInServer, session: ClientSession, rounds: int, warmup: int
+) -> dict[str, Result]:
+    """Time parsing, pulling and the getters of DiveraClient.
+
+    Args:
+        server (StandInServer): The running stand-in server.
+        session (ClientSession): Client session for making HTTP requests.
+        rounds (int): Number of measured rounds.
+        warmup (int): Number of rounds run before measuring.
+
+    Returns:
+        dict[str, Result]: The timings by benchmark name.
+
+    """
+    results: dict[str, Result] = {}
+    body = encode(server.payload)
+    results["decode"] = measure_sync(lambda: json_loads(body), rounds, warmup)
+    results["snapshot.from_payload"] = measure_sync(
+        lambda: DiveraSnapshot.from_payload(server.payload), rounds, warmup
+    )
+
+    async def pull_full() -> None:
+        fetcher = DiveraFetcher(
+            session, ACCESSKEY, base_url=server.base_url, sections=REQUIRED_SECTIONS
+        )
+        client = DiveraClient(
+            session, ACCESSKEY, base_url=server.base_url, ucr_id=1, fetcher=fetcher
+        )
+        await client.pull_data()
+
+    results["pull_data.full"] = await measure(pull_full, rounds, warmup)
+
+    fetcher = DiveraFetcher(
+        session,
+        ACCESSKEY,
+        base_url=server.base_url,
+        tick=0,
+        sections=REQUIRED_SECTIONS,
+    )
+    client = DiveraClient(
+        session, ACCESSKEY, base_url=server.base_url, ucr_id=1, fetcher=fetcher
+    )
+    await client.pull_data()
+    results["pull_data.not_modified"] = await measure(client.pull_data, rounds, warmup)
+
+    for name, getter in GETTERS.items():
+        results[f"getter.{name}"] = measure_sync(
+            lambda getter=getter: getter(client), rounds * 10, warmup
+        )
+    return results
+
+
+async def run_cycle_benchmarks(
+    server: StandInServer, session: ClientSession, rounds: int, warmup: int
+) -> dict[str, Result]:
+    """Time coordinator refreshes up to the state write of the entities.
+
+    The entities of the sensor and select platforms are added through entity
+    components of a bare Home Assistant instance, as during a normal setup.
+
+    Args:
+        server (StandInServer): The running stand-in server.
+        session (ClientSession): Client session for making HTTP requests.
+        rounds (int): Number of measured rounds.
+        warmup (int): Number of rounds run before measuring.
+
+    Returns:
+        dict[str, Result]: The timings by benchmark name.
+
+    """
+    from custom_components.divera import select, sensor
+    from custom_components.divera.const import LOGGER
+    from custom_components.divera.coordinator import DiveraCoordinator
+    from homeassistant.components.select import DOMAIN as SELECT_DOMAIN
+    from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+    from homeassistant.helpers.entity_component import EntityComponent
+
+    platforms = (
+        (SENSOR_DOMAIN, sensor.DiveraSensorEntity, sensor.SENSORS),
+        (SELECT_DOMAIN, select.DiveraSelectEntity, select.SENSORS),
+    )
+
+    results: dict[str, Result] = {}
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        await dr.async_load(hass)
+        await er.async_load(hass)
+
+        fetcher = DiveraFetcher(session, ACCESSKEY, base_url=server.base_url, tick=0)
+        coordinator = DiveraCoordinator(
+            hass, session, ACCESSKEY, server.base_url, ucr_id=1, fetcher=fetcher
+        )
+        await coordinator.async_refresh()
+
+        for domain, entity_cls, descriptions in platforms:
+            component = EntityComponent(LOGGER, domain, hass)
+            await component.async_add_entities(
+                [entity_cls(coordinator, description) for description in descriptions]
+            )
+
+        async def refresh_changed() -> None:
+            server.touch()
+            await coordinator.async_refresh()
+
+        results["cycle.changed"] = await measure(refresh_changed, rounds, warmup)
+        results["cycle.not_modified"] = await measure(
+            coordinator.async_refresh, rounds, warmup
+        )
+
+        await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+    return results
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run all benchmarks.
+
+    Args:
+        args (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        dict[str, Any]: The parameters of the run and the results by name.
+
+    """
+    payload = build_payload(
+        args.members,
+        args.groups,
+        args.states,
+        args.alarms,
+        args.ucrs,
+        args.seed,
+        args.events,
+    )
+    async with StandInServer(payload) as server, ClientSession() as session:
+        results = await run_client_benchmarks(server, session, args.rounds, args.warmup)
+        if args.skip_cycle:
+            print("Skipping coordinator cycle benchmarks", file=sys.stderr)
+        else:
+            results.update(
+                await run_cycle_benchmarks(server, session, args.rounds, args.warmup)
+            )
+
+    return {
+        "meta": {
+            "members": args.members,
+            "groups": args.groups,
+            "states": args.states,
+            "alarms": args.alarms,
+            "events": args.events,
+            "ucrs": args.ucrs,
+            "seed": args.seed,
+            "body_bytes": len(encode(payload)),
+            "orjson": orjson is not None,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "results": {name: asdict(result) for name, result in results.items()},
+    }
+
+
+def report(
+    report_data: dict[str, Any], baseline: dict[str, Any] | None, tolerance: float
+) -> list[str]:
+    """Print the results as table and compare them to a baseline.
+
+    Args:
+        report_data (dict[str, Any]): The results of this run.
+        baseline (dict[str, Any] | None): The results of a previous run.
+        tolerance (float): Allowed relative slowdown of the median.
+
+    Returns:
+        list[str]: Names of the benchmarks that got slower than allowed.
+
+    """
+    previous = (baseline or {}).get("results", {})
+    regressions = []
+    print(f"{'benchmark':<40} {'median ms':>12} {'p95 ms':>12} {'min ms':>12}", end="")
+    print(f" {'change':>9}" if baseline else "")
+    for name, result in report_data["results"].items():
+        line = (
+            f"{name:<40} {result['median']:>12.4f} "
+            f"{result['p95']:>12.4f} {result['minimum']:>12.4f}"
+        )
+        if name in previous and previous[name]["median"]:
+            change = result["median"] / previous[name]["median"] - 1
+            line += f" {change:>+8.1%}"
+            if change > tolerance:
+                regressions.append(name)
+                line += " !"
+        print(line)
+    return regressions
+
+
+def main() -> int:
+    """Parse the command line, run the benchmarks and report the results.
+
+    Returns:
+        int: The exit status, 1 if a benchmark regressed.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=2000)
+    parser.add_argument("--groups", type=int, default=200)
+    parser.add_argument("--states", type=int, default=20)
+    parser.add_argument("--alarms", type=int, default=1000)
+    parser.add_argument("--ucrs", type=int, default=5)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument(
+        "--skip-cycle",
+        action="store_true",
+        help="skip the coordinator cycle benchmarks",
+    )
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--compare", type=Path, help="JSON results to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed relative slowdown of a median (default: 0.2)",
+    )
+    args = parser.parse_args()
+
+    report_data = asyncio.run(run(args))
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    if baseline and baseline.get("meta", {}).get("members") != args.members:
+        print("Baseline was run with different parameters", file=sys.stderr)
+    regressions = report(report_data, baseline, args.tolerance)
+    if args.output:
+        args.output.write_text(json.dumps(report_data, indent=2) + "\n")
+    if regressions:
+        print(f"Regressions: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())